@@ -12,6 +12,7 @@ from azure.core.credentials import AccessToken
 
 from pydo.custom_policies import CustomHttpLoggingPolicy
 from pydo.custom_extensions import _BaseURLProxy, INFERENCE_BASE_URL
+from pydo.custom_pagination import install_pagination_helpers
 from pydo import GeneratedClient, _version
 
 try:
@@ -91,6 +92,7 @@ class Client(  # type: ignore
         )
 
         self._setup_inference_routing(inference_endpoint, agent_endpoint)
+        self._setup_pagination_helpers()
 
         self._inference_resource_root = None
         self._agent_inference_resource_root = None
@@ -144,6 +146,15 @@ class Client(  # type: ignore
             elif class_name.startswith("Inference"):
                 attr._client = inference_proxy
 
+    def _setup_pagination_helpers(self) -> None:
+        """Add ``iter_<method>`` companions to every paginated operation group.
+
+        See :mod:`pydo.custom_pagination`.
+        """
+        for attr in self.__dict__.values():
+            if hasattr(attr, "_client"):
+                install_pagination_helpers(attr)
+
     def _require_inference_resource_root(self):
         if self._inference_resource_root is None:
             raise RuntimeError(
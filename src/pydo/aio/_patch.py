@@ -14,6 +14,7 @@ from azure.core.credentials_async import AsyncTokenCredential
 from pydo import _version
 from pydo.custom_policies import CustomHttpLoggingPolicy
 from pydo.custom_extensions import _BaseURLProxy, INFERENCE_BASE_URL
+from pydo.custom_pagination import install_pagination_helpers
 from pydo.aio import GeneratedClient
 
 if TYPE_CHECKING:
@@ -97,6 +98,7 @@ class Client(  # type: ignore
         )
 
         self._setup_inference_routing(inference_endpoint, agent_endpoint)
+        self._setup_pagination_helpers()
 
         self._inference_resource_root = None
         self._agent_inference_resource_root = None
@@ -150,6 +152,14 @@ class Client(  # type: ignore
             elif class_name.startswith("Inference"):
                 attr._client = inference_proxy
 
+    def _setup_pagination_helpers(self) -> None:
+        """Add async ``iter_<method>`` companions to every paginated operation
+        group.  See :mod:`pydo.custom_pagination`.
+        """
+        for attr in self.__dict__.values():
+            if hasattr(attr, "_client"):
+                install_pagination_helpers(attr, is_async=True)
+
     def _require_inference_resource_root(self):
         if self._inference_resource_root is None:
             raise RuntimeError(
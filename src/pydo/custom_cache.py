@@ -0,0 +1,453 @@
+# ------------------------------------
+# Copyright (c) DigitalOcean.
+# Licensed under the Apache-2.0 License.
+# ------------------------------------
+"""Response cache storage used by :class:`pydo.custom_policies.ResponseCachePolicy`.
+
+This file is preserved during ``make clean`` (matches the custom_*.py pattern)
+and is NOT overwritten by code generation.
+
+* ``CachedResponse``  – a detached snapshot (status, headers, body) of a GET
+  response that the generated operations can deserialize like the original.
+
+* ``MemoryCacheBackend``  – thread-safe in-process LRU store with per-entry
+  expiry.  Any object with the same ``get`` / ``set`` / ``invalidate``
+  methods can be passed to the cache policy as a backend.
+
+* ``SqliteCacheBackend``  – the same interface persisted to a SQLite file,
+  shared safely by every process and thread that opens it, with entry-count
+  and byte-size caps.
+
+* ``CATALOG_TTLS``  – default time-to-live per endpoint for catalog data that
+  rarely changes (regions, sizes, distribution images, option listings, ...).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+from azure.core.exceptions import HttpResponseError
+from azure.core.utils import case_insensitive_dict
+
+# Pending read times after which a SqliteCacheBackend lookup writes them
+# itself instead of leaving them to the next ``set``.
+_TOUCH_BATCH = 64
+
+# Endpoint -> TTL in seconds.  A ``?key=value`` suffix only matches requests
+# carrying that query parameter.
+CATALOG_TTLS: Dict[str, float] = {
+    "/v2/regions": 3600,
+    "/v2/sizes": 3600,
+    "/v2/images?type=distribution": 3600,
+    "/v2/kubernetes/options": 3600,
+    "/v2/databases/options": 3600,
+    "/v2/registry/options": 3600,
+    "/v2/apps/tiers/instance_sizes": 3600,
+    "/v1/models": 600,
+}
+
+
+class CachedResponse:
+    """Detached copy of an HTTP response that owns its body.
+
+    Implements the subset of :class:`azure.core.rest.HttpResponse` used by the
+    generated operations (``status_code``, ``headers``, ``content``,
+    ``json()``), so it can be returned from a pipeline in place of a live
+    response for both the sync and the async client.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        reason: str = "OK",
+        url: str = "",
+    ):
+        self.status_code = status_code
+        self.headers = case_insensitive_dict(headers)
+        self._content = content
+        self.reason = reason
+        self.url = url
+        self.request = None
+        self.is_closed = True
+        self.is_stream_consumed = True
+
+    @classmethod
+    def from_response(cls, response: Any) -> "CachedResponse":
+        """Snapshot a response whose body has already been loaded."""
+        return cls(
+            response.status_code,
+            dict(response.headers),
+            response.content,
+            getattr(response, "reason", "") or "",
+            str(getattr(response, "url", "") or ""),
+        )
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self.headers.get("Content-Type")
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        return self._content.decode(encoding or self.encoding)
+
+    def json(self) -> Any:
+        return json.loads(self.text()) if self._content else None
+
+    def read(self) -> bytes:
+        return self._content
+
+    def iter_bytes(self, **kwargs: Any) -> Iterator[bytes]:
+        yield self._content
+
+    iter_raw = iter_bytes
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HttpResponseError(response=self)
+
+    def close(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return f"<CachedResponse: {self.status_code} {self.reason}>"
+
+
+class MemoryCacheBackend:
+    """Thread-safe in-memory LRU store of :class:`CachedResponse` objects.
+
+    :keyword max_entries: Entries kept before the least recently used one is
+        evicted. Default value is 256.
+    :paramtype max_entries: int
+    """
+
+    def __init__(self, *, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop every entry, or only those whose URL path starts with *path*."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if urlparse(k).path.startswith(path)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _default_cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "pydo", "responses.sqlite3")
+
+
+class SqliteCacheBackend:
+    """Persistent :class:`CachedResponse` store backed by a SQLite file.
+
+    Several processes (CLI invocations, cron jobs, workers) can point at the
+    same file: SQLite's locking serializes writers and WAL journaling lets
+    readers proceed concurrently.  Lookups never wait for the write lock:
+    read times are recorded in batches, by the next write or, every
+    64 lookups, by a write attempt that is skipped if another connection
+    holds the lock.  Expiry uses wall-clock time so it holds across
+    processes.  Least recently read entries are evicted first once
+    *max_entries* or *max_bytes* is exceeded; as read times are batched,
+    the order is approximate.
+
+    Entries live under a namespace, so one file can hold the responses of
+    several accounts without mixing them: pass the client's token as
+    *credential* to derive it, or an explicit *namespace*.
+
+    Usage::
+
+        backend = SqliteCacheBackend(credential=token)
+        client = Client(
+            token, per_call_policies=[ResponseCachePolicy(backend=backend)]
+        )
+
+    :param path: Database file. Defaults to
+        ``$XDG_CACHE_HOME/pydo/responses.sqlite3``.
+    :type path: str
+    :keyword max_entries: Default value is 4096.
+    :paramtype max_entries: int
+    :keyword max_bytes: Cap on the summed body size. Default value is 64 MiB.
+    :paramtype max_bytes: int
+    :keyword namespace: Prefix for every key. Required unless *credential*
+        is given; pass ``""`` only for a file used by a single account.
+    :paramtype namespace: str
+    :keyword credential: API token whose digest is used as the namespace.
+    :paramtype credential: str
+    :keyword timeout: Seconds to wait for another process's lock.
+        Default value is 10.
+    :paramtype timeout: float
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            status INTEGER NOT NULL,
+            reason TEXT NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL
+        )
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        max_entries: int = 4096,
+        max_bytes: int = 64 * 1024 * 1024,
+        namespace: Optional[str] = None,
+        credential: Optional[str] = None,
+        timeout: float = 10.0,
+    ):
+        if namespace is None:
+            if credential is None:
+                raise ValueError(
+                    "SqliteCacheBackend needs a namespace or the client's "
+                    "credential, so that accounts sharing the file stay apart."
+                )
+            namespace = _credential_digest(credential) + ":"
+        self.path = path or _default_cache_path()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.timeout = timeout
+        self._local = threading.local()
+        # Read times not yet written, flushed with the next write.
+        self._touched: Dict[str, float] = {}
+        self._touch_lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(self._SCHEMA)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed_at)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self) -> "_SqliteTransaction":
+        return _SqliteTransaction(self._connection())
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        now = time.time()
+        stored_key = self.namespace + key
+        row = (
+            self._connection()
+            .execute(
+                "SELECT expires_at, status, reason, headers, body "
+                "FROM responses WHERE key = ?",
+                (stored_key,),
+            )
+            .fetchone()
+        )
+        # Expired rows are left for the next write to evict.
+        if row is None or row[0] <= now:
+            return None
+        with self._touch_lock:
+            self._touched[stored_key] = now
+            flush = len(self._touched) >= _TOUCH_BATCH
+        if flush:
+            self._try_flush_touched()
+        return CachedResponse(row[1], json.loads(row[3]), bytes(row[4]), row[2], key)
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        now = time.time()
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, path, expires_at, accessed_at, status, reason, headers, "
+                "body, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.namespace + key,
+                    urlparse(key).path,
+                    now + ttl,
+                    now,
+                    response.status_code,
+                    response.reason or "",
+                    json.dumps(dict(response.headers)),
+                    sqlite3.Binary(body),
+                    len(body),
+                ),
+            )
+            self._flush_touched(conn)
+            self._evict(conn, now)
+
+    def _try_flush_touched(self) -> None:
+        """Write pending read times unless another connection holds the lock."""
+        conn = self._connection()
+        conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            with _SqliteTransaction(conn):
+                self._flush_touched(conn)
+        except sqlite3.OperationalError:
+            pass  # Busy: the next write records them.
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        with self._touch_lock:
+            touched, self._touched = self._touched, {}
+        try:
+            conn.executemany(
+                "UPDATE responses SET accessed_at = MAX(accessed_at, ?) "
+                "WHERE key = ?",
+                [(at, key) for key, at in touched.items()],
+            )
+        except sqlite3.Error:
+            with self._touch_lock:
+                for key, at in touched.items():
+                    self._touched.setdefault(key, at)
+            raise
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        count, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        for key, entry_size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            count -= 1
+            size -= entry_size
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop every entry in this namespace, or only those whose URL path
+        starts with *path*."""
+        prefix = self.namespace
+        with self._transaction() as conn:
+            if path is None:
+                conn.execute(
+                    "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+            else:
+                conn.execute(
+                    "DELETE FROM responses WHERE substr(key, 1, ?) = ? "
+                    "AND substr(path, 1, ?) = ?",
+                    (len(prefix), prefix, len(path), path),
+                )
+
+    def __len__(self) -> int:
+        return (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*) FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(self.namespace), self.namespace),
+            )
+            .fetchone()[0]
+        )
+
+    def close(self) -> None:
+        """Close this thread's connection to the database."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class _SqliteTransaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` / ``ROLLBACK`` around a block."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def _credential_digest(credential: str) -> str:
+    """Short stable identifier of the account behind *credential* (a token),
+    used to scope cache keys without storing the token itself."""
+    return hashlib.sha256(credential.encode("utf-8")).hexdigest()[:16]
+
+
+def _compile_ttls(ttls: Mapping[str, float]) -> List[Tuple[str, Dict[str, str], float]]:
+    rules = []
+    for rule, ttl in ttls.items():
+        parsed = urlparse(rule)
+        rules.append((parsed.path.rstrip("/"), dict(parse_qsl(parsed.query)), ttl))
+    # Rules with query conditions are more specific; check them first.
+    rules.sort(key=lambda r: len(r[1]), reverse=True)
+    return rules
+
+
+def _ttl_for(
+    url: str,
+    rules: List[Tuple[str, Dict[str, str], float]],
+    default_ttl: Optional[float],
+) -> Optional[float]:
+    parsed = urlparse(url)
+    path = parsed.path.rstrip("/")
+    query = dict(parse_qsl(parsed.query))
+    for rule_path, conditions, ttl in rules:
+        if path != rule_path:
+            continue
+        if all(query.get(k) == v for k, v in conditions.items()):
+            return ttl
+    return default_ttl
@@ -0,0 +1,240 @@
+# ------------------------------------
+# Copyright (c) DigitalOcean.
+# Licensed under the Apache-2.0 License.
+# ------------------------------------
+"""Adaptive concurrency control for bulk operations.
+
+This file is preserved during ``make clean`` (matches the custom_*.py pattern)
+and is NOT overwritten by code generation.
+
+* ``AdaptiveLimiter``  – an AIMD (additive increase, multiplicative decrease)
+  window on the number of requests in flight.  The window grows by about one
+  slot per window's worth of healthy responses and is cut by
+  ``backoff`` whenever the API answers ``429`` or ``503``.  Both threads and
+  asyncio tasks may wait on the same limiter.
+
+* ``AdaptiveConcurrencyPolicy`` / ``AsyncAdaptiveConcurrencyPolicy`` in
+  :mod:`pydo.custom_policies` gate every request of a client through a
+  limiter, so any bulk call path (thread pools, ``asyncio.gather``, the
+  helpers in ``custom_*`` modules) adapts without further changes.
+
+Usage::
+
+    limiter = AdaptiveLimiter(initial=4, max_limit=64)
+    client = Client(
+        token, per_retry_policies=[AdaptiveConcurrencyPolicy(limiter)]
+    )
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        list(pool.map(client.droplets.get, droplet_ids))
+    print(limiter.limit, limiter.throttled)
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional
+
+# Statuses that signal the API is overloaded or throttling this token.
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class AdaptiveLimiter:
+    """AIMD limit on concurrent requests, shared by threads and tasks.
+
+    A slot is taken with :meth:`acquire` (or :meth:`acquire_async`) and given
+    back with :meth:`release`, which reports how the request went:
+
+    * a healthy response (no error, latency within *latency_target* when one
+      is set) grows the window by ``increase / limit``, i.e. by *increase*
+      once a full window has completed;
+    * a throttled response (``429``/``503``) multiplies the window by
+      *backoff*.  Requests that were already in flight when the window was
+      cut do not cut it again, so one burst of 429s halves it only once;
+    * any other failure, or a slow response, leaves the window unchanged.
+
+    :keyword initial: Starting window. Default value is 4.
+    :paramtype initial: int
+    :keyword min_limit: Smallest window. Default value is 1.
+    :paramtype min_limit: int
+    :keyword max_limit: Largest window. Default value is 64.
+    :paramtype max_limit: int
+    :keyword increase: Slots added per window of healthy responses. Default
+        value is 1.
+    :paramtype increase: float
+    :keyword backoff: Factor applied to the window on throttling. Default
+        value is 0.5.
+    :paramtype backoff: float
+    :keyword latency_target: Responses slower than this many seconds stop the
+        window from growing. Default value is None (latency is ignored).
+    :paramtype latency_target: float
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_target: Optional[float] = None,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self.completed = 0
+        self.throttled = 0
+        self.failed = 0
+        self._window = float(min(max(initial, min_limit), max_limit))
+        self._cut_at = 0.0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._async_waiters: Deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._window)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the window and counters, e.g. for metrics export."""
+        with self._lock:
+            return {
+                "limit": int(self._window),
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "throttled": self.throttled,
+                "failed": self.failed,
+            }
+
+    def _try_take(self) -> Optional[float]:
+        if self.in_flight < int(self._window):
+            self.in_flight += 1
+            return time.monotonic()
+        return None
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """Block until a slot is free and take it.
+
+        Returns the start time to pass back to :meth:`release`.  Raises
+        :class:`TimeoutError` if no slot frees up within *timeout* seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                started = self._try_take()
+                if started is not None:
+                    return started
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("no concurrency slot became available")
+                self._changed.wait(remaining)
+
+    async def acquire_async(self) -> float:
+        """Suspend the current task until a slot is free and take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                started = self._try_take()
+                if started is not None:
+                    return started
+                waiter = loop.create_future()
+                self._async_waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                    else:
+                        # Woken but cancelled before running: pass it on.
+                        self._wake_locked()
+                raise
+
+    def release(
+        self,
+        started: Optional[float] = None,
+        *,
+        status: Optional[int] = None,
+        error: bool = False,
+    ) -> None:
+        """Give back a slot and adjust the window.
+
+        :param started: Value returned by :meth:`acquire`; used to measure
+            latency and to ignore throttling of requests that started before
+            the last cut.
+        :keyword status: HTTP status of the response, if any.
+        :keyword error: ``True`` if the request failed without a response.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+            self.completed += 1
+            if status in THROTTLE_STATUSES:
+                self.throttled += 1
+                if started is None or started >= self._cut_at:
+                    self._window = max(
+                        float(self.min_limit), self._window * self.backoff
+                    )
+                    self._cut_at = now
+            elif error or (status is not None and status >= 500):
+                self.failed += 1
+            elif self.latency_target is None or (
+                started is not None and now - started <= self.latency_target
+            ):
+                self._window = min(
+                    float(self.max_limit),
+                    self._window + self.increase / self._window,
+                )
+            self._changed.notify_all()
+            self._wake_locked()
+
+    def _wake_locked(self) -> None:
+        free = int(self._window) - self.in_flight
+        while free > 0 and self._async_waiters:
+            waiter = self._async_waiters.popleft()
+            if waiter.done():
+                continue
+            waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+            free -= 1
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of a ``with`` block.
+
+        Exceptions carrying a ``status_code`` (e.g.
+        :class:`~azure.core.exceptions.HttpResponseError`) are reported with
+        that status, so throttling raised as an error still cuts the window.
+        """
+        started = self.acquire()
+        try:
+            yield
+        except Exception as err:
+            status = getattr(err, "status_code", None)
+            self.release(started, status=status, error=status is None)
+            raise
+        except BaseException:
+            self.release(started, error=True)
+            raise
+        self.release(started)
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveLimiter(limit={self.limit}, in_flight={self.in_flight}, "
+            f"throttled={self.throttled})"
+        )
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
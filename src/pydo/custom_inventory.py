@@ -0,0 +1,309 @@
+# ------------------------------------
+# Copyright (c) DigitalOcean.
+# Licensed under the Apache-2.0 License.
+# ------------------------------------
+"""Account-wide inventory snapshots.
+
+This file is preserved during ``make clean`` (matches the custom_*.py pattern)
+and is NOT overwritten by code generation.
+
+* ``collect_inventory`` / ``async_collect_inventory``  – fan out across the
+  list operations named in :data:`INVENTORY_RESOURCES`, paginate each one
+  (see :mod:`pydo.custom_pagination`) and return an
+  :class:`InventorySnapshot`.  Domain records are fetched per domain as soon
+  as the domain list arrives.
+
+* ``InventorySnapshot``  – the collected resources plus indexes by id, name,
+  tag, region and VPC.
+
+Usage::
+
+    inventory = collect_inventory(client, max_workers=8)
+    web = inventory.by_tag("web")["droplets"]
+    droplet = inventory.by_id("droplets", 3164444)
+"""
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydo.custom_pagination import MAX_PER_PAGE, async_paginate, paginate
+
+# Resource kind -> (operation group attribute, list method, item key).
+INVENTORY_RESOURCES: Dict[str, Tuple[str, str, str]] = {
+    "droplets": ("droplets", "list", "droplets"),
+    "volumes": ("volumes", "list", "volumes"),
+    "snapshots": ("snapshots", "list", "snapshots"),
+    "domains": ("domains", "list", "domains"),
+    "firewalls": ("firewalls", "list", "firewalls"),
+    "load_balancers": ("load_balancers", "list", "load_balancers"),
+    "reserved_ips": ("reserved_ips", "list", "reserved_ips"),
+    "kubernetes_clusters": ("kubernetes", "list_clusters", "kubernetes_clusters"),
+    "databases": ("databases", "list_clusters", "databases"),
+    "apps": ("apps", "list", "apps"),
+    "vpcs": ("vpcs", "list", "vpcs"),
+    "tags": ("tags", "list", "tags"),
+}
+
+# Pseudo-kind fetched with ``domains.list_records`` for every collected domain.
+DOMAIN_RECORDS = "domain_records"
+
+# Kinds whose unique key is not ``id``.
+_ID_FIELDS: Dict[str, str] = {
+    "domains": "name",
+    "reserved_ips": "ip",
+    "tags": "name",
+}
+
+# Fields that reference the VPC a resource lives in.
+_VPC_FIELDS = ("vpc_uuid", "private_network_uuid")
+
+
+def _region_slugs(item: Dict[str, Any]) -> List[str]:
+    """Normalize the different region shapes used across resources."""
+    slugs = []
+    region = item.get("region")
+    if isinstance(region, dict):
+        region = region.get("slug")
+    if isinstance(region, str) and region:
+        slugs.append(region)
+    for extra in item.get("regions") or ():
+        if isinstance(extra, dict):
+            extra = extra.get("slug")
+        if isinstance(extra, str) and extra and extra not in slugs:
+            slugs.append(extra)
+    return slugs
+
+
+def _tag_names(item: Dict[str, Any]) -> List[str]:
+    tags = item.get("tags") or []
+    if isinstance(item.get("tag"), str) and item["tag"]:
+        tags = list(tags) + [item["tag"]]
+    names = []
+    for tag in tags:
+        if isinstance(tag, dict):
+            tag = tag.get("name")
+        if isinstance(tag, str) and tag:
+            names.append(tag)
+    return names
+
+
+class InventorySnapshot:
+    """Point-in-time view of an account's resources with lookup indexes.
+
+    ``snapshot["droplets"]`` returns the raw list of collected droplets.
+    The ``by_*`` lookups return resources grouped by kind.
+    """
+
+    def __init__(
+        self,
+        resources: Dict[str, List[Dict[str, Any]]],
+        domain_records: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        taken_at: Optional[float] = None,
+    ):
+        self.resources = resources
+        self.domain_records = domain_records or {}
+        self.taken_at = time.time() if taken_at is None else taken_at
+        if self.domain_records:
+            self.resources[DOMAIN_RECORDS] = [
+                record for records in self.domain_records.values() for record in records
+            ]
+
+        self._ids: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        self._names: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._tags: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._regions: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._vpcs: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for kind, items in self.resources.items():
+            self._index(kind, items)
+
+    def _index(self, kind: str, items: Iterable[Dict[str, Any]]) -> None:
+        id_field = _ID_FIELDS.get(kind, "id")
+        ids = self._ids.setdefault(kind, {})
+        names = self._names.setdefault(kind, {})
+        for item in items:
+            if item.get(id_field) is not None:
+                ids[item[id_field]] = item
+            if isinstance(item.get("name"), str):
+                names.setdefault(item["name"], []).append(item)
+            for tag in _tag_names(item):
+                self._tags.setdefault(tag, {}).setdefault(kind, []).append(item)
+            for region in _region_slugs(item):
+                self._regions.setdefault(region, {}).setdefault(kind, []).append(item)
+            vpc = next((item[f] for f in _VPC_FIELDS if item.get(f)), None)
+            if kind == "vpcs":
+                vpc = item.get("id")
+            if vpc:
+                self._vpcs.setdefault(vpc, {}).setdefault(kind, []).append(item)
+
+    def __getitem__(self, kind: str) -> List[Dict[str, Any]]:
+        return self.resources[kind]
+
+    def __contains__(self, kind: str) -> bool:
+        return kind in self.resources
+
+    def kinds(self) -> List[str]:
+        """Resource kinds present in this snapshot."""
+        return list(self.resources)
+
+    def by_id(self, kind: str, resource_id: Any) -> Optional[Dict[str, Any]]:
+        """Return the *kind* resource with the given id (or ``None``)."""
+        return self._ids.get(kind, {}).get(resource_id)
+
+    def by_name(self, kind: str, name: str) -> List[Dict[str, Any]]:
+        """Return every *kind* resource called *name*."""
+        return list(self._names.get(kind, {}).get(name, []))
+
+    def by_tag(self, tag: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Return resources carrying *tag*, grouped by kind."""
+        return {k: list(v) for k, v in self._tags.get(tag, {}).items()}
+
+    def by_region(self, region: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Return resources in the *region* slug, grouped by kind."""
+        return {k: list(v) for k, v in self._regions.get(region, {}).items()}
+
+    def by_vpc(self, vpc_uuid: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Return resources attached to *vpc_uuid* (and the VPC itself),
+        grouped by kind."""
+        return {k: list(v) for k, v in self._vpcs.get(vpc_uuid, {}).items()}
+
+    def records_for(self, domain_name: str) -> List[Dict[str, Any]]:
+        """Return the DNS records collected for *domain_name*."""
+        return list(self.domain_records.get(domain_name, []))
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{k}={len(v)}" for k, v in self.resources.items())
+        return f"InventorySnapshot({counts})"
+
+
+def _resolve_kinds(kinds: Optional[Iterable[str]]) -> Tuple[List[str], bool]:
+    selected = list(INVENTORY_RESOURCES) + [DOMAIN_RECORDS]
+    if kinds is not None:
+        selected = list(kinds)
+    unknown = [
+        k for k in selected if k not in INVENTORY_RESOURCES and k != DOMAIN_RECORDS
+    ]
+    if unknown:
+        raise ValueError(f"unknown inventory resource kind(s): {unknown}")
+    with_records = DOMAIN_RECORDS in selected
+    if with_records and "domains" not in selected:
+        selected.append("domains")
+    return [k for k in selected if k != DOMAIN_RECORDS], with_records
+
+
+def collect_inventory(
+    client,
+    kinds: Optional[Iterable[str]] = None,
+    *,
+    max_workers: int = 8,
+    per_page: int = MAX_PER_PAGE,
+) -> InventorySnapshot:
+    """Collect every resource kind concurrently into an
+    :class:`InventorySnapshot`.
+
+    *kinds* restricts collection to a subset of :data:`INVENTORY_RESOURCES`
+    (plus ``"domain_records"``); by default everything is collected.  Up to
+    *max_workers* list calls run at once on a thread pool.  The first error
+    raised by any list call is re-raised once in-flight calls finish.
+    """
+    selected, with_records = _resolve_kinds(kinds)
+    resources: Dict[str, List[Dict[str, Any]]] = {}
+    records: Dict[str, List[Dict[str, Any]]] = {}
+
+    def fetch(kind: str) -> List[Dict[str, Any]]:
+        group, method, item_key = INVENTORY_RESOURCES[kind]
+        method = getattr(getattr(client, group), method)
+        return list(paginate(method, per_page=per_page, item_key=item_key))
+
+    def fetch_records(domain_name: str) -> List[Dict[str, Any]]:
+        return list(
+            paginate(
+                client.domains.list_records,
+                domain_name,
+                per_page=per_page,
+                item_key="domain_records",
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(fetch, kind): ("kind", kind) for kind in selected}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    what, name = pending.pop(future)
+                    result = future.result()
+                    if what == "records":
+                        records[name] = result
+                        continue
+                    resources[name] = result
+                    if name == "domains" and with_records:
+                        for domain in result:
+                            pending[pool.submit(fetch_records, domain["name"])] = (
+                                "records",
+                                domain["name"],
+                            )
+        finally:
+            for future in pending:
+                future.cancel()
+
+    ordered = {kind: resources[kind] for kind in selected}
+    return InventorySnapshot(ordered, records if with_records else None)
+
+
+async def async_collect_inventory(
+    client,
+    kinds: Optional[Iterable[str]] = None,
+    *,
+    max_concurrency: int = 8,
+    per_page: int = MAX_PER_PAGE,
+) -> InventorySnapshot:
+    """Async variant of :func:`collect_inventory` for ``pydo.aio.Client``.
+
+    At most *max_concurrency* list calls are in flight at once.
+    """
+    selected, with_records = _resolve_kinds(kinds)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def collect(method, *args, item_key: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return [
+                item
+                async for item in async_paginate(
+                    method, *args, per_page=per_page, item_key=item_key
+                )
+            ]
+
+    async def fetch(kind: str) -> List[Dict[str, Any]]:
+        group, method, item_key = INVENTORY_RESOURCES[kind]
+        return await collect(getattr(getattr(client, group), method), item_key=item_key)
+
+    records: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def fetch_domains_and_records() -> List[Dict[str, Any]]:
+        domains = await fetch("domains")
+        results = await asyncio.gather(
+            *(
+                collect(
+                    client.domains.list_records,
+                    domain["name"],
+                    item_key="domain_records",
+                )
+                for domain in domains
+            )
+        )
+        for domain, domain_records in zip(domains, results):
+            records[domain["name"]] = domain_records
+        return domains
+
+    fetches = [
+        (
+            fetch_domains_and_records()
+            if kind == "domains" and with_records
+            else fetch(kind)
+        )
+        for kind in selected
+    ]
+    results = await asyncio.gather(*fetches)
+    resources = dict(zip(selected, results))
+    return InventorySnapshot(resources, records if with_records else None)
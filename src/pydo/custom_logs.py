@@ -0,0 +1,534 @@
+# ------------------------------------
+# Copyright (c) DigitalOcean.
+# Licensed under the Apache-2.0 License.
+# ------------------------------------
+"""Streaming App Platform logs.
+
+This file is preserved during ``make clean`` (matches the custom_*.py pattern)
+and is NOT overwritten by code generation.
+
+``apps.get_logs`` and its variants only return URLs: ``historic_urls`` for
+log files already written and a ``live_url`` that keeps streaming while the
+component runs.
+
+* ``iter_app_logs`` / ``async_iter_app_logs``  – request the URLs for one or
+  many components of an app concurrently, then read every URL line by line
+  and yield :class:`LogLine` tuples as they arrive (a generator and an async
+  generator).  Historic files are downloaded concurrently, live URLs are
+  followed until the caller stops iterating, and lines pass through a
+  bounded queue, so memory use does not depend on the size of the logs.
+
+* ``iter_url_lines`` / ``async_iter_url_lines``  – the same line-by-line
+  reading for a single log URL, and ``get_log_urls`` /
+  ``async_get_log_urls`` to pick the right ``get_logs*`` call.
+
+The URLs are presigned, so they are fetched without the API token (the
+standard library for the sync client, ``aiohttp`` for ``pydo.aio``).  A
+``live_url`` may be a WebSocket (``wss://``) URL, which only the async API
+can follow.
+
+Usage::
+
+    for line in iter_app_logs(client, app_id, ["web", "worker"], follow=True):
+        print(f"[{line.component}] {line.text}")
+"""
+import asyncio
+import codecs
+import functools
+import http.client
+import io
+import queue
+import socket
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Lines buffered between the readers and the consumer.
+DEFAULT_QUEUE_SIZE = 1000
+
+# Bytes requested per read from an async log stream.
+_CHUNK_SIZE = 64 * 1024
+
+# Seconds a sync live reader waits for data before checking whether the
+# consumer stopped; it then keeps reading the same response.
+_LIVE_READ_TIMEOUT = 5.0
+
+_WEBSOCKET_SCHEMES = ("ws://", "wss://")
+
+
+class LogLine(NamedTuple):
+    """One log line.
+
+    ``component`` is the component name (``None`` for aggregated logs) and
+    ``live`` tells whether the line came from the live URL rather than a
+    historic file.
+    """
+
+    component: Optional[str]
+    text: str
+    live: bool = False
+
+
+class _Source(NamedTuple):
+    component: Optional[str]
+    url: str
+    live: bool
+
+
+def get_log_urls(
+    client,
+    app_id: str,
+    component: Optional[str] = None,
+    *,
+    deployment_id: Optional[str] = None,
+    type: str = "RUN",  # pylint: disable=redefined-builtin
+    follow: bool = False,
+) -> Dict[str, Any]:
+    """Request the log URLs of one component, or of the whole app when
+    *component* is ``None``, for *deployment_id* or the active deployment.
+
+    Returns the ``apps.get_logs*`` response with ``historic_urls`` and
+    ``live_url``.
+    """
+    apps = client.apps
+    if component is None and deployment_id is None:
+        return apps.get_logs_active_deployment_aggregate(
+            app_id, follow=follow, type=type
+        )
+    if component is None:
+        return apps.get_logs_aggregate(app_id, deployment_id, follow=follow, type=type)
+    if deployment_id is None:
+        return apps.get_logs_active_deployment(
+            app_id, component, follow=follow, type=type
+        )
+    return apps.get_logs(app_id, deployment_id, component, follow=follow, type=type)
+
+
+def _components(components: Optional[Iterable[str]]) -> List[Optional[str]]:
+    return list(components) if components else [None]
+
+
+def _sources(component: Optional[str], urls: Dict[str, Any]) -> List[_Source]:
+    sources = [
+        _Source(component, url, False) for url in urls.get("historic_urls") or ()
+    ]
+    if urls.get("live_url"):
+        sources.append(_Source(component, urls["live_url"], True))
+    return sources
+
+
+def _text(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+
+def _is_websocket(url: str) -> bool:
+    return url.lower().startswith(_WEBSOCKET_SCHEMES)
+
+
+# ----------------------------------------------------------------------------
+# Sync
+# ----------------------------------------------------------------------------
+
+
+def iter_url_lines(url: str, *, timeout: Optional[float] = 120.0) -> Iterator[str]:
+    """Yield the lines of the log at *url* as they are received.
+
+    *timeout* bounds connecting and each read; pass ``None`` to wait
+    indefinitely.  WebSocket (``ws://`` / ``wss://``) URLs raise
+    :class:`ValueError`; follow them with :func:`async_iter_url_lines` or
+    :func:`async_iter_app_logs`.
+    """
+    return _url_lines(urllib.request.urlopen, url, timeout)
+
+
+def _url_lines(
+    open_url: Callable[..., Any], url: str, timeout: Optional[float]
+) -> Iterator[str]:
+    if _is_websocket(url):
+        raise ValueError(
+            f"{url.split(':', 1)[0]}:// log URLs need the async API; use "
+            "async_iter_url_lines or async_iter_app_logs with pydo.aio.Client"
+        )
+    request = urllib.request.Request(url=url, method="GET")
+    with open_url(request, timeout=timeout) as response:
+        for raw in response:
+            yield _text(raw)
+
+
+class _PatientSocketReader(io.RawIOBase):
+    """Unbuffered reader over the socket of a live log response.
+
+    Unlike :class:`socket.SocketIO` it survives read timeouts: each one asks
+    *stopped* whether to give up and otherwise reads the same connection
+    again, so no line is lost or received twice.
+    """
+
+    def __init__(self, sock, keepalive, stopped: Callable[[], bool]) -> None:
+        super().__init__()
+        self._sock = sock
+        # The file made by HTTPResponse; holding it keeps the socket open.
+        self._keepalive = keepalive
+        self._stopped = stopped
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while True:
+            try:
+                return self._sock.recv_into(buffer)
+            except socket.timeout:
+                if self._stopped():
+                    raise
+
+    def close(self) -> None:
+        if not self.closed:
+            self._keepalive.close()
+        super().close()
+
+
+class _LiveResponse(http.client.HTTPResponse):
+    def __init__(self, sock, *args: Any, stopped: Callable[[], bool], **kwargs: Any):
+        super().__init__(sock, *args, **kwargs)
+        self.fp = io.BufferedReader(_PatientSocketReader(sock, self.fp, stopped))
+
+
+class _LiveHandlerMixin:
+    """Open connections whose responses are read by
+    :class:`_PatientSocketReader`."""
+
+    stopped: Callable[[], bool]
+
+    def do_open(self, http_class, req, **http_conn_args):
+        def connect(host: str, **kwargs: Any) -> http.client.HTTPConnection:
+            connection = http_class(host, **kwargs)
+            connection.response_class = functools.partial(
+                _LiveResponse, stopped=self.stopped
+            )
+            return connection
+
+        return super().do_open(connect, req, **http_conn_args)
+
+
+class _LiveHTTPHandler(_LiveHandlerMixin, urllib.request.HTTPHandler):
+    pass
+
+
+class _LiveHTTPSHandler(_LiveHandlerMixin, urllib.request.HTTPSHandler):
+    pass
+
+
+def _iter_live_lines(url: str, stopped: Callable[[], bool]) -> Iterator[str]:
+    """Follow the live log at *url* until it ends or *stopped* returns true,
+    checking it every :data:`_LIVE_READ_TIMEOUT` seconds of silence."""
+    handlers = [_LiveHTTPHandler(), _LiveHTTPSHandler()]
+    for handler in handlers:
+        handler.stopped = stopped
+    opener = urllib.request.build_opener(*handlers)
+    return _url_lines(opener.open, url, _LIVE_READ_TIMEOUT)
+
+
+def iter_app_logs(
+    client,
+    app_id: str,
+    components: Optional[Sequence[str]] = None,
+    *,
+    deployment_id: Optional[str] = None,
+    type: str = "RUN",  # pylint: disable=redefined-builtin
+    follow: bool = False,
+    max_workers: int = 8,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    timeout: Optional[float] = 120.0,
+    on_error: Optional[Callable[[Optional[str], BaseException], None]] = None,
+) -> Iterator[LogLine]:
+    """Yield the log lines of *components* (the aggregated app log when
+    ``None``) as they are read.
+
+    Up to *max_workers* historic files are downloaded at once; with
+    ``follow=True`` each live URL is followed on its own thread until the
+    generator is closed (a silent live URL is checked every few seconds to
+    notice that).  Lines of one URL keep their order, lines of different
+    URLs interleave.  A failing URL raises its error here after the other
+    readers are stopped, unless *on_error* is given, in which case it is
+    called with the component and the exception and the rest go on.
+    WebSocket live URLs fail with :class:`ValueError`, see
+    :func:`iter_url_lines`.
+    """
+    targets = _components(components)
+    lines: "queue.Queue[Tuple[Any, ...]]" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put(item: Tuple[Any, ...]) -> bool:
+        while not stop.is_set():
+            try:
+                lines.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(source: _Source) -> None:
+        if stop.is_set():
+            return
+        try:
+            if source.live:
+                texts = _iter_live_lines(source.url, stop.is_set)
+            else:
+                texts = iter_url_lines(source.url, timeout=timeout)
+            for text in texts:
+                if not put(("line", LogLine(source.component, text, source.live))):
+                    return
+        except Exception as err:  # pylint: disable=broad-except
+            put(("error", source.component, err))
+        finally:
+            put(("done",))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        requests = [
+            pool.submit(
+                get_log_urls,
+                client,
+                app_id,
+                component,
+                deployment_id=deployment_id,
+                type=type,
+                follow=follow,
+            )
+            for component in targets
+        ]
+        sources = [
+            source
+            for component, future in zip(targets, requests)
+            for source in _sources(component, future.result())
+        ]
+
+    historic = ThreadPoolExecutor(max_workers=max_workers)
+    for source in sources:
+        if source.live:
+            threading.Thread(
+                target=read, args=(source,), name="pydo-live-log", daemon=True
+            ).start()
+        else:
+            historic.submit(read, source)
+    pending = len(sources)
+    try:
+        while pending:
+            item = lines.get()
+            if item[0] == "line":
+                yield item[1]
+            elif item[0] == "done":
+                pending -= 1
+            elif on_error is None:
+                raise item[2]
+            else:
+                on_error(item[1], item[2])
+    finally:
+        stop.set()
+        historic.shutdown(wait=False)
+
+
+# ----------------------------------------------------------------------------
+# Async
+# ----------------------------------------------------------------------------
+
+
+async def async_get_log_urls(
+    client,
+    app_id: str,
+    component: Optional[str] = None,
+    *,
+    deployment_id: Optional[str] = None,
+    type: str = "RUN",  # pylint: disable=redefined-builtin
+    follow: bool = False,
+) -> Dict[str, Any]:
+    """Async variant of :func:`get_log_urls` for ``pydo.aio.Client``."""
+    apps = client.apps
+    if component is None and deployment_id is None:
+        return await apps.get_logs_active_deployment_aggregate(
+            app_id, follow=follow, type=type
+        )
+    if component is None:
+        return await apps.get_logs_aggregate(
+            app_id, deployment_id, follow=follow, type=type
+        )
+    if deployment_id is None:
+        return await apps.get_logs_active_deployment(
+            app_id, component, follow=follow, type=type
+        )
+    return await apps.get_logs(
+        app_id, deployment_id, component, follow=follow, type=type
+    )
+
+
+class _LineBuffer:
+    """Split a byte stream into lines across chunk boundaries."""
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._buffer = ""
+
+    def feed(self, chunk: bytes) -> List[str]:
+        self._buffer += self._decoder.decode(chunk)
+        *complete, self._buffer = self._buffer.split("\n")
+        return [line.rstrip("\r") for line in complete]
+
+    def flush(self) -> List[str]:
+        rest = self._buffer + self._decoder.decode(b"", True)
+        self._buffer = ""
+        return [rest.rstrip("\r")] if rest else []
+
+
+async def async_iter_url_lines(
+    url: str, *, timeout: Optional[float] = 120.0, session=None
+) -> AsyncIterator[str]:
+    """Async variant of :func:`iter_url_lines`.
+
+    Uses *session* (an :class:`aiohttp.ClientSession`) when given, otherwise
+    a session of its own.  WebSocket (``ws://`` / ``wss://``) URLs are
+    followed over a WebSocket connection, each message holding whole lines.
+    """
+    import aiohttp  # pylint: disable=import-outside-toplevel
+
+    own = session is None
+    if own:
+        session = aiohttp.ClientSession()
+    try:
+        if _is_websocket(url):
+            async for line in _iter_websocket_lines(session, url, timeout):
+                yield line
+            return
+        client_timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=timeout, sock_read=timeout
+        )
+        async with session.get(url, timeout=client_timeout) as response:
+            response.raise_for_status()
+            buffer = _LineBuffer()
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                for line in buffer.feed(chunk):
+                    yield line
+            for line in buffer.flush():
+                yield line
+    finally:
+        if own:
+            await session.close()
+
+
+async def _iter_websocket_lines(
+    session, url: str, timeout: Optional[float]
+) -> AsyncIterator[str]:
+    import aiohttp  # pylint: disable=import-outside-toplevel
+
+    ws_timeout = getattr(aiohttp, "ClientWSTimeout", None)
+    if ws_timeout is None:  # aiohttp < 3.11
+        options = {"receive_timeout": timeout}
+    else:
+        options = {"timeout": ws_timeout(ws_receive=timeout, ws_close=10.0)}
+    async with session.ws_connect(url, **options) as websocket:
+        async for message in websocket:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                text = message.data
+            elif message.type == aiohttp.WSMsgType.BINARY:
+                text = message.data.decode("utf-8", errors="replace")
+            elif message.type == aiohttp.WSMsgType.ERROR:
+                raise websocket.exception()
+            else:
+                break
+            for line in text.splitlines():
+                yield line
+
+
+async def async_iter_app_logs(
+    client,
+    app_id: str,
+    components: Optional[Sequence[str]] = None,
+    *,
+    deployment_id: Optional[str] = None,
+    type: str = "RUN",  # pylint: disable=redefined-builtin
+    follow: bool = False,
+    max_concurrency: int = 8,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    timeout: Optional[float] = 120.0,
+    on_error: Optional[Callable[[Optional[str], BaseException], None]] = None,
+) -> AsyncIterator[LogLine]:
+    """Async variant of :func:`iter_app_logs` for ``pydo.aio.Client``.
+
+    *max_concurrency* bounds the historic downloads; live URLs are always
+    followed.
+    """
+    import aiohttp  # pylint: disable=import-outside-toplevel
+
+    targets = _components(components)
+    responses = await asyncio.gather(
+        *(
+            async_get_log_urls(
+                client,
+                app_id,
+                component,
+                deployment_id=deployment_id,
+                type=type,
+                follow=follow,
+            )
+            for component in targets
+        )
+    )
+    sources = [
+        source
+        for component, urls in zip(targets, responses)
+        for source in _sources(component, urls)
+    ]
+    lines: "asyncio.Queue[Tuple[Any, ...]]" = asyncio.Queue(maxsize=queue_size)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read(session, source: _Source) -> None:
+        try:
+            if source.live:
+                await _pump(session, source, lines, None)
+            else:
+                async with semaphore:
+                    await _pump(session, source, lines, timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            await lines.put(("error", source.component, err))
+        await lines.put(("done",))
+
+    async with aiohttp.ClientSession() as session:
+        tasks = [asyncio.ensure_future(read(session, s)) for s in sources]
+        pending = len(tasks)
+        try:
+            while pending:
+                item = await lines.get()
+                if item[0] == "line":
+                    yield item[1]
+                elif item[0] == "done":
+                    pending -= 1
+                elif on_error is None:
+                    raise item[2]
+                else:
+                    on_error(item[1], item[2])
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _pump(
+    session, source: _Source, lines: "asyncio.Queue", timeout: Optional[float]
+) -> None:
+    async for text in async_iter_url_lines(
+        source.url, timeout=timeout, session=session
+    ):
+        await lines.put(("line", LogLine(source.component, text, source.live)))
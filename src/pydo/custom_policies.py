@@ -1,4 +1,30 @@
-from azure.core.pipeline.policies import HttpLoggingPolicy
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import (
+    AsyncHTTPPolicy,
+    AsyncRetryPolicy,
+    HTTPPolicy,
+    HttpLoggingPolicy,
+    RetryPolicy,
+    SansIOHTTPPolicy,
+)
+
+from pydo.custom_cache import (
+    CATALOG_TTLS,
+    CachedResponse,
+    MemoryCacheBackend,
+    _compile_ttls,
+    _credential_digest,
+    _ttl_for,
+)
+from pydo.custom_concurrency import AdaptiveLimiter
 
 
 class CustomHttpLoggingPolicy(HttpLoggingPolicy):
@@ -24,3 +50,680 @@ class CustomHttpLoggingPolicy(HttpLoggingPolicy):
     def __init__(self, logger=None, **kwargs):
         super().__init__(logger, **kwargs)
         self.allowed_header_names.update(self.ALLOWED_HEADERS)
+
+
+class _ValidatedResponse:  # pylint: disable=too-few-public-methods
+    """A stored GET response and the validators needed to revalidate it."""
+
+    __slots__ = ("response", "etag", "last_modified")
+
+    def __init__(
+        self, response: Any, etag: Optional[str], last_modified: Optional[str]
+    ):
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ConditionalRequestPolicy(SansIOHTTPPolicy):
+    """Revalidate repeated GETs with ``If-None-Match`` / ``If-Modified-Since``.
+
+    The ``ETag`` and ``Last-Modified`` validators of every successful GET are
+    stored per URL.  The next GET of that URL sends them back; when the API
+    answers ``304 Not Modified`` the stored response is handed to the caller
+    instead of raising :class:`~azure.core.exceptions.ResourceNotModifiedError`,
+    and the pipeline context gets ``context["not_modified"] = True``.
+
+    The policy is opt-in and works with both ``pydo.Client`` and
+    ``pydo.aio.Client``::
+
+        policy = ConditionalRequestPolicy(credential=token)
+        client = Client(token, per_call_policies=[policy])
+
+    The policy runs before authentication, so the request carries no token:
+    pass the client's token as *credential* to keep the validators and stored
+    responses of different accounts apart.  Without it entries are keyed by
+    URL alone and the instance must never be shared between clients using
+    different tokens.
+
+    :keyword max_entries: Number of URLs to remember; the least recently used
+        entry is dropped beyond that. Default value is 1024.
+    :paramtype max_entries: int
+    :keyword credential: API token of the client, used (as a digest) to scope
+        the stored entries to its account.
+    :paramtype credential: str
+    """
+
+    _CONTEXT_KEY = "pydo_conditional_entry"
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        credential: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        super().__init__()
+        self.max_entries = max_entries
+        self._scope = "#" + _credential_digest(credential) if credential else ""
+        self._entries: "OrderedDict[str, _ValidatedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def on_request(self, request: PipelineRequest) -> None:
+        http_request = request.http_request
+        if http_request.method != "GET":
+            return
+        key = http_request.url + self._scope
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            return
+        headers = http_request.headers
+        if entry.etag and "If-None-Match" not in headers:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified and "If-Modified-Since" not in headers:
+            headers["If-Modified-Since"] = entry.last_modified
+        request.context[self._CONTEXT_KEY] = entry
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        http_request = request.http_request
+        if http_request.method != "GET":
+            return
+        http_response = response.http_response
+        entry = request.context.get(self._CONTEXT_KEY)
+        if http_response.status_code == 304 and entry is not None:
+            response.http_response = entry.response
+            response.context["not_modified"] = True
+            with self._lock:
+                self.hits += 1
+            return
+        if http_response.status_code != 200 or request.context.options.get("stream"):
+            return
+        etag = http_response.headers.get("ETag")
+        last_modified = http_response.headers.get("Last-Modified")
+        key = http_request.url + self._scope
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = _ValidatedResponse(http_response, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Forget the stored response for *url*, or for every URL."""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(url + self._scope, None)
+
+
+class _ResponseCacheBase:
+    """Logic shared by :class:`ResponseCachePolicy` and
+    :class:`AsyncResponseCachePolicy`."""
+
+    def __init__(
+        self,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        max_entries: int = 256,
+        backend: Any = None,
+        credential: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        super().__init__()
+        self._scope = "#" + _credential_digest(credential) if credential else ""
+        self.backend = (
+            backend
+            if backend is not None
+            else MemoryCacheBackend(max_entries=max_entries)
+        )
+        self._rules = _compile_ttls(CATALOG_TTLS if ttls is None else ttls)
+        self._default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_slot(self, request: PipelineRequest) -> Optional[Tuple[str, float]]:
+        http_request = request.http_request
+        if http_request.method != "GET" or request.context.options.get("stream"):
+            return None
+        ttl = _ttl_for(http_request.url, self._rules, self._default_ttl)
+        if not ttl or ttl <= 0:
+            return None
+        return http_request.url + self._scope, ttl
+
+    def _lookup(self, request: PipelineRequest, key: str) -> Optional[PipelineResponse]:
+        cached = self.backend.get(key)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        request.context["cache_hit"] = True
+        return PipelineResponse(request.http_request, cached, context=request.context)
+
+    def _store(self, key: str, ttl: float, response: PipelineResponse) -> None:
+        if response.http_response.status_code == 200:
+            self.backend.set(
+                key, CachedResponse.from_response(response.http_response), ttl
+            )
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop cached responses, optionally only those under URL *path*
+        (e.g. ``"/v2/sizes"``)."""
+        self.backend.invalidate(path)
+
+
+class ResponseCachePolicy(_ResponseCacheBase, HTTPPolicy):
+    """Serve repeated GETs of rarely-changing endpoints from a local cache.
+
+    Only endpoints listed in *ttls* (path, optionally with a required
+    ``?key=value`` query) are cached, each for its own time-to-live.
+    Cached answers never reach the network; the pipeline context gets
+    ``context["cache_hit"] = True``.
+
+    The policy runs before authentication, so the request carries no token:
+    pass the client's token as *credential* to keep the entries of different
+    accounts apart.  Without it entries are keyed by URL alone and the
+    instance (and its backend) must never be shared between clients using
+    different tokens.
+
+    Usage::
+
+        cache = ResponseCachePolicy(max_entries=512, credential=token)
+        client = Client(token, per_call_policies=[cache])
+        client.sizes.list()  # network
+        client.sizes.list()  # cache
+        cache.invalidate("/v2/sizes")
+
+    :keyword ttls: Endpoint to TTL (seconds) mapping. Defaults to
+        :data:`pydo.custom_cache.CATALOG_TTLS`.
+    :paramtype ttls: dict[str, float]
+    :keyword default_ttl: TTL for GETs not matched by *ttls*. Default value is
+        None (not cached).
+    :paramtype default_ttl: float
+    :keyword max_entries: Size of the default in-memory LRU backend.
+        Default value is 256.
+    :paramtype max_entries: int
+    :keyword backend: Alternative storage with ``get``/``set``/``invalidate``.
+    :keyword credential: API token of the client, used (as a digest) to scope
+        the cache keys to its account.
+    :paramtype credential: str
+    """
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        slot = self._cache_slot(request)
+        if slot is None:
+            return self.next.send(request)
+        key, ttl = slot
+        cached = self._lookup(request, key)
+        if cached is not None:
+            return cached
+        response = self.next.send(request)
+        self._store(key, ttl, response)
+        return response
+
+
+class AsyncResponseCachePolicy(_ResponseCacheBase, AsyncHTTPPolicy):
+    """Async variant of :class:`ResponseCachePolicy` for ``pydo.aio.Client``.
+
+    Accepts the same keyword arguments; a backend instance may be shared
+    with a sync policy.
+    """
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        slot = self._cache_slot(request)
+        if slot is None:
+            return await self.next.send(request)
+        key, ttl = slot
+        cached = self._lookup(request, key)
+        if cached is not None:
+            return cached
+        response = await self.next.send(request)
+        self._store(key, ttl, response)
+        return response
+
+
+def _single_flight_key(request: PipelineRequest, scope: str) -> Optional[str]:
+    """Identity of a GET for coalescing: URL (with query) plus credentials."""
+    http_request = request.http_request
+    if http_request.method != "GET" or request.context.options.get("stream"):
+        return None
+    # Only present when the policy is placed after authentication.
+    auth = http_request.headers.get("Authorization") or ""
+    digest = hashlib.sha256(auth.encode("utf-8")).hexdigest() if auth else ""
+    return f"{scope}{digest} {http_request.url}"
+
+
+class _Flight:  # pylint: disable=too-few-public-methods
+    """One in-flight GET that concurrent identical requests wait on."""
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlightPolicy(HTTPPolicy):
+    """Collapse identical concurrent GETs into a single HTTP call.
+
+    While a GET for a URL is in flight, other threads issuing the same GET
+    (same URL, query and credentials) wait for it instead of sending their
+    own request, then receive a copy of its response, or its exception.
+    Requests are not cached: once the call completes, the next GET goes to
+    the network again.
+
+    As a per-call policy it runs before authentication, so the request does
+    not carry the token yet: pass the client's token as *credential* to key
+    the flights by account as well as URL.  An instance belongs to a single
+    client (the pipeline links it to that client's next policy); never pass
+    one to clients using different tokens.
+
+    Usage::
+
+        policy = SingleFlightPolicy(credential=token)
+        client = Client(token, per_call_policies=[policy])
+
+    :keyword credential: API token of the client, used (as a digest) to keep
+        requests of different accounts apart.
+    :paramtype credential: str
+    """
+
+    def __init__(
+        self, *, credential: Optional[str] = None, **kwargs: Any
+    ):  # pylint: disable=unused-argument
+        super().__init__()
+        self._scope = _credential_digest(credential) if credential else ""
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        key = _single_flight_key(request, self._scope)
+        if key is None:
+            return self.next.send(request)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return PipelineResponse(
+                request.http_request,
+                CachedResponse.from_response(flight.response),
+                context=request.context,
+            )
+        try:
+            response = self.next.send(request)
+            flight.response = response.http_response
+            return response
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlightPolicy(AsyncHTTPPolicy):
+    """Async variant of :class:`SingleFlightPolicy` for ``pydo.aio.Client``.
+
+    The shared request runs as its own task, so cancelling the task that
+    started it does not cancel it for the other waiters.
+    """
+
+    def __init__(
+        self, *, credential: Optional[str] = None, **kwargs: Any
+    ):  # pylint: disable=unused-argument
+        super().__init__()
+        self._scope = _credential_digest(credential) if credential else ""
+        self._flights: Dict[str, "asyncio.Future[PipelineResponse]"] = {}
+        self.coalesced = 0
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        key = _single_flight_key(request, self._scope)
+        if key is None:
+            return await self.next.send(request)
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            response = await asyncio.shield(flight)
+            return PipelineResponse(
+                request.http_request,
+                CachedResponse.from_response(response.http_response),
+                context=request.context,
+            )
+        flight = asyncio.ensure_future(self.next.send(request))
+        self._flights[key] = flight
+        flight.add_done_callback(lambda task: self._land(key, task))
+        return await asyncio.shield(flight)
+
+    def _land(self, key: str, task: "asyncio.Future[PipelineResponse]") -> None:
+        self._flights.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled.
+            task.exception()
+
+
+def _header_number(headers: Any, name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Thread- and task-safe token bucket paced by the API's rate-limit headers.
+
+    Every request takes one token.  Tokens refill continuously at a rate
+    learned from each response: ``ratelimit-remaining`` spread over the
+    seconds left until ``ratelimit-reset``, never above *max_rate*.  When the
+    API reports no remaining budget, requests wait until the reset time.
+    Callers that would exceed the budget are delayed individually, so
+    requests are spread out evenly instead of bursting into 429s.
+
+    One instance should be shared by everything using the same token, e.g.
+    by passing it to the policy of every client and worker::
+
+        limiter = RateLimiter()
+        client = Client(token, per_retry_policies=[RateLimitPolicy(limiter)])
+
+    :keyword rate: Initial refill rate in requests per second, used until the
+        first response is seen. Default value is 5000 per hour.
+    :paramtype rate: float
+    :keyword max_rate: Upper bound for the learned rate. Default value is
+        250 per minute.
+    :paramtype max_rate: float
+    :keyword burst: Bucket capacity. Default value is 10.
+    :paramtype burst: int
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 5000 / 3600,
+        max_rate: float = 250 / 60,
+        burst: int = 10,
+    ):
+        self.max_rate = max_rate
+        self.burst = burst
+        self.rate = min(rate, max_rate)
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.throttled = 0
+        self.waited = 0.0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = 0.0
+            if self._tokens < 0:
+                delay = -self._tokens / self.rate if self.rate > 0 else 0.0
+            delay = max(delay, self._resume_at - now)
+            if delay > 0:
+                self.throttled += 1
+                self.waited += delay
+            return delay
+
+    def acquire(self) -> None:
+        """Block the current thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Suspend the current task until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, headers: Any) -> None:
+        """Learn the budget from ``ratelimit-*`` response headers."""
+        limit = _header_number(headers, "ratelimit-limit")
+        remaining = _header_number(headers, "ratelimit-remaining")
+        reset = _header_number(headers, "ratelimit-reset")
+        if remaining is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.remaining = int(remaining)
+            if limit is not None:
+                self.limit = int(limit)
+            window = None
+            if reset is not None:
+                window = max(reset - time.time(), 0.0)
+            if remaining <= 0:
+                self._tokens = min(self._tokens, 0.0)
+                if window is not None:
+                    self._resume_at = now + window
+                return
+            self._resume_at = 0.0
+            self._tokens = min(self._tokens, remaining)
+            if window:
+                self.rate = min(remaining / window, self.max_rate)
+
+
+class RateLimitPolicy(HTTPPolicy):
+    """Pace outgoing requests with a shared :class:`RateLimiter`.
+
+    Add it with ``per_retry_policies`` so every attempt, including retries,
+    takes a token::
+
+        client = Client(token, per_retry_policies=[RateLimitPolicy(limiter)])
+
+    :param limiter: Limiter shared with other clients using the same token.
+        A private one is created when omitted.
+    :type limiter: ~pydo.custom_policies.RateLimiter
+    """
+
+    def __init__(self, limiter: Optional[RateLimiter] = None, **kwargs: Any):
+        super().__init__()
+        self.limiter = limiter if limiter is not None else RateLimiter(**kwargs)
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        self.limiter.acquire()
+        response = self.next.send(request)
+        self.limiter.update(response.http_response.headers)
+        return response
+
+
+class AsyncRateLimitPolicy(AsyncHTTPPolicy):
+    """Async variant of :class:`RateLimitPolicy` for ``pydo.aio.Client``.
+
+    The limiter may be shared with sync policies.
+    """
+
+    def __init__(self, limiter: Optional[RateLimiter] = None, **kwargs: Any):
+        super().__init__()
+        self.limiter = limiter if limiter is not None else RateLimiter(**kwargs)
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        await self.limiter.acquire_async()
+        response = await self.next.send(request)
+        self.limiter.update(response.http_response.headers)
+        return response
+
+
+class _RateLimitRetryMixin:
+    """Retry timing shared by :class:`RateLimitRetryPolicy` and
+    :class:`AsyncRateLimitRetryPolicy`."""
+
+    def __init__(self, **kwargs: Any):
+        self.jitter: float = kwargs.pop("retry_jitter", 1.0)
+        self.limiter: Optional[RateLimiter] = kwargs.pop("limiter", None)
+        super().__init__(**kwargs)
+        self._stats_lock = threading.Lock()
+        self.retries = 0
+        self.rate_limited_retries = 0
+        self.slept = 0.0
+
+    def is_retry(self, settings: Dict[str, Any], response: PipelineResponse) -> bool:
+        # A 429 was rejected before any work happened, so even POSTs are
+        # safe to send again.
+        if response.http_response.status_code == 429:
+            if self.limiter is not None:
+                self.limiter.update(response.http_response.headers)
+            return bool(settings["total"])
+        return super().is_retry(settings, response)  # type: ignore[misc]
+
+    def increment(
+        self,
+        settings: Dict[str, Any],
+        response: Any = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        retry_active = super().increment(  # type: ignore[misc]
+            settings, response=response, error=error
+        )
+        if retry_active:
+            status = getattr(
+                getattr(response, "http_response", None), "status_code", None
+            )
+            with self._stats_lock:
+                self.retries += 1
+                if status == 429:
+                    self.rate_limited_retries += 1
+        return retry_active
+
+    def get_retry_after(self, response: PipelineResponse) -> Optional[float]:
+        """Seconds to wait: ``Retry-After`` if sent, otherwise the time left
+        until ``ratelimit-reset`` on a 429, plus up to ``retry_jitter``
+        seconds of random jitter."""
+        delay = super().get_retry_after(response)  # type: ignore[misc]
+        http_response = response.http_response
+        if delay is None and http_response.status_code == 429:
+            reset = _header_number(http_response.headers, "ratelimit-reset")
+            if reset is not None:
+                delay = max(reset - time.time(), 0.0)
+        if delay is None:
+            return None
+        delay += random.uniform(0, self.jitter)
+        with self._stats_lock:
+            self.slept += delay
+        return delay
+
+    def get_backoff_time(self, settings: Dict[str, Any]) -> float:
+        """Exponential backoff with "equal jitter": half fixed, half random."""
+        backoff = super().get_backoff_time(settings)  # type: ignore[misc]
+        backoff = backoff / 2 + random.uniform(0, backoff / 2)
+        with self._stats_lock:
+            self.slept += backoff
+        return backoff
+
+
+class RateLimitRetryPolicy(_RateLimitRetryMixin, RetryPolicy):
+    """Retry policy that waits exactly as long as the API asks.
+
+    Differences from azure-core's :class:`~azure.core.pipeline.policies.RetryPolicy`:
+
+    * On ``429 Too Many Requests`` it sleeps until ``Retry-After`` or, when
+      that is absent, until the epoch in ``ratelimit-reset``, and retries
+      every method since the request was not processed.
+    * Every wait gets random jitter so a fleet of workers throttled at the
+      same moment does not retry in lockstep.
+    * ``retries``, ``rate_limited_retries`` and ``slept`` count the retries
+      taken and the seconds spent waiting.
+
+    Usage::
+
+        client = Client(token, retry_policy=RateLimitRetryPolicy(retry_total=5))
+
+    Accepts every ``RetryPolicy`` keyword plus:
+
+    :keyword retry_jitter: Upper bound in seconds of the jitter added to
+        server-directed waits. Default value is 1.0.
+    :paramtype retry_jitter: float
+    :keyword limiter: A shared :class:`RateLimiter` that also learns from
+        429 responses.
+    :paramtype limiter: ~pydo.custom_policies.RateLimiter
+    """
+
+
+class AsyncRateLimitRetryPolicy(_RateLimitRetryMixin, AsyncRetryPolicy):
+    """Async variant of :class:`RateLimitRetryPolicy` for ``pydo.aio.Client``."""
+
+
+class AdaptiveConcurrencyPolicy(HTTPPolicy):
+    """Cap in-flight requests with a shared AIMD :class:`AdaptiveLimiter`.
+
+    Each attempt holds a slot while it is on the wire and reports its status
+    and latency when it completes, so the window widens while the API is
+    healthy and narrows on ``429``/``503``.  Add it with
+    ``per_retry_policies`` so that retry backoff does not occupy a slot::
+
+        limiter = AdaptiveLimiter(max_limit=32)
+        client = Client(
+            token, per_retry_policies=[AdaptiveConcurrencyPolicy(limiter)]
+        )
+
+    :param limiter: Limiter shared by every client and thread doing the bulk
+        work.  A private one is created from ``kwargs`` when omitted.
+    :type limiter: ~pydo.custom_concurrency.AdaptiveLimiter
+    """
+
+    def __init__(self, limiter: Optional[AdaptiveLimiter] = None, **kwargs: Any):
+        super().__init__()
+        self.limiter = limiter if limiter is not None else AdaptiveLimiter(**kwargs)
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        started = self.limiter.acquire()
+        try:
+            response = self.next.send(request)
+        except BaseException:
+            self.limiter.release(started, error=True)
+            raise
+        self.limiter.release(started, status=response.http_response.status_code)
+        return response
+
+
+class AsyncAdaptiveConcurrencyPolicy(AsyncHTTPPolicy):
+    """Async variant of :class:`AdaptiveConcurrencyPolicy` for
+    ``pydo.aio.Client``."""
+
+    def __init__(self, limiter: Optional[AdaptiveLimiter] = None, **kwargs: Any):
+        super().__init__()
+        self.limiter = limiter if limiter is not None else AdaptiveLimiter(**kwargs)
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        started = await self.limiter.acquire_async()
+        try:
+            response = await self.next.send(request)
+        except BaseException:
+            self.limiter.release(started, error=True)
+            raise
+        self.limiter.release(started, status=response.http_response.status_code)
+        return response
@@ -0,0 +1,473 @@
+# ------------------------------------
+# Copyright (c) DigitalOcean.
+# Licensed under the Apache-2.0 License.
+# ------------------------------------
+"""Streaming BIND zone-file import and export for domains.
+
+This file is preserved during ``make clean`` (matches the custom_*.py pattern)
+and is NOT overwritten by code generation.
+
+* ``export_zone`` / ``async_export_zone``  – page through
+  ``domains.list_records`` lazily and write each record as a BIND zone-file
+  line, so memory use does not grow with the zone.
+
+* ``parse_zone``  – incremental zone-file parser.  It reads any iterable of
+  lines (e.g. an open file) and yields record bodies ready for
+  ``domains.create_record``.  ``$ORIGIN``, ``$TTL``, inherited owners,
+  parentheses, quoted strings and comments are understood.
+
+* ``import_zone`` / ``async_import_zone``  – create the parsed records
+  concurrently.  Only a bounded window of records is in flight at any time,
+  so a 200k-record migration runs in constant memory.
+
+Usage::
+
+    with open("example.com.zone", "w") as out:
+        export_zone(client, "example.com", out)
+
+    with open("example.com.zone") as zone:
+        result = import_zone(client, "example.com", zone, max_workers=8)
+    print(result.created, result.failed, result.skipped)
+"""
+import asyncio
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from azure.core.exceptions import AzureError
+
+from pydo.custom_pagination import MAX_PER_PAGE, async_paginate, paginate
+from pydo.exceptions import ZoneFileError
+
+# Record types DigitalOcean DNS accepts through ``domains.create_record``.
+SUPPORTED_TYPES = frozenset({"A", "AAAA", "CAA", "CNAME", "MX", "NS", "SRV", "TXT"})
+
+# Types whose data (or target) is a host name.
+_HOST_TYPES = frozenset({"CNAME", "MX", "NS", "SRV"})
+
+_CLASSES = frozenset({"IN", "CH", "HS", "CS"})
+
+_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+# TXT strings longer than this are split into several quoted strings.
+_TXT_CHUNK = 255
+
+# Units only separate the numbers, so each digit run matches one way.
+_TTL_RE = re.compile(r"^(?:\d+[smhdw])*\d+[smhdw]?$", re.IGNORECASE)
+
+
+def _parse_ttl(token: str) -> Optional[int]:
+    if not _TTL_RE.match(token):
+        return None
+    if token.isdigit():
+        return int(token)
+    return sum(
+        int(number) * _TTL_UNITS[unit.lower()]
+        for number, unit in re.findall(r"(\d+)([smhdw])", token, re.IGNORECASE)
+    )
+
+
+def _fqdn(name: str, origin: str) -> str:
+    """Absolute form (with trailing dot) of *name* relative to *origin*."""
+    if name == "@":
+        return origin
+    if name.endswith("."):
+        return name.lower()
+    return f"{name}.{origin}".lower()
+
+
+def _relative(fqdn: str, domain: str) -> str:
+    """Record name relative to *domain* as used by the API (``@`` for apex)."""
+    if fqdn == domain:
+        return "@"
+    if fqdn.endswith("." + domain):
+        return fqdn[: -len(domain) - 1]
+    return fqdn.rstrip(".")
+
+
+def _quote(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+    return '"' + escaped + '"'
+
+
+# ----------------------------------------------------------------------------
+# Export
+# ----------------------------------------------------------------------------
+
+
+def _export_host(data: str) -> str:
+    if data == "@" or data.endswith(".") or "." not in data:
+        return data
+    return data + "."
+
+
+def format_record(record: Mapping[str, Any]) -> Optional[str]:
+    """Format one API record as a zone-file line (``None`` for SOA)."""
+    record_type = str(record["type"]).upper()
+    if record_type == "SOA":
+        # DigitalOcean manages the SOA record and only exposes its TTL.
+        return None
+    data = str(record.get("data") or "")
+    if record_type in _HOST_TYPES:
+        data = _export_host(data)
+    if record_type == "MX":
+        data = f"{record.get('priority') or 0} {data}"
+    elif record_type == "SRV":
+        data = (
+            f"{record.get('priority') or 0} {record.get('weight') or 0} "
+            f"{record.get('port') or 0} {data}"
+        )
+    elif record_type == "CAA":
+        data = f"{record.get('flags') or 0} {record.get('tag')} {_quote(data)}"
+    elif record_type == "TXT":
+        chunks = [data[i : i + _TXT_CHUNK] for i in range(0, len(data), _TXT_CHUNK)]
+        data = " ".join(_quote(chunk) for chunk in chunks or [""])
+    ttl = record.get("ttl")
+    ttl_field = f"{ttl}\t" if ttl else ""
+    return f"{record.get('name') or '@'}\t{ttl_field}IN\t{record_type}\t{data}\n"
+
+
+def _zone_header(domain: str) -> str:
+    return f"$ORIGIN {domain.rstrip('.')}.\n"
+
+
+def export_zone(
+    client, domain: str, out: TextIO, *, per_page: int = MAX_PER_PAGE
+) -> int:
+    """Write every record of *domain* to *out* as a BIND zone file.
+
+    Records are fetched one page at a time and written as they arrive.
+    Returns the number of records written.
+    """
+    out.write(_zone_header(domain))
+    written = 0
+    for record in paginate(
+        client.domains.list_records,
+        domain,
+        per_page=per_page,
+        item_key="domain_records",
+    ):
+        line = format_record(record)
+        if line is not None:
+            out.write(line)
+            written += 1
+    return written
+
+
+async def async_export_zone(
+    client, domain: str, out: TextIO, *, per_page: int = MAX_PER_PAGE
+) -> int:
+    """Async variant of :func:`export_zone` for ``pydo.aio.Client``.
+
+    The next page is fetched while the current one is being written.
+    """
+    out.write(_zone_header(domain))
+    written = 0
+    async for record in async_paginate(
+        client.domains.list_records,
+        domain,
+        per_page=per_page,
+        item_key="domain_records",
+    ):
+        line = format_record(record)
+        if line is not None:
+            out.write(line)
+            written += 1
+    return written
+
+
+# ----------------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------------
+
+
+def _tokenize(line: str, lineno: int) -> Tuple[List[str], int]:
+    """Split *line* into tokens, unquoting strings and dropping comments.
+
+    Returns the tokens and the change in parenthesis depth.
+    """
+    tokens: List[str] = []
+    depth = 0
+    i, length = 0, len(line)
+    while i < length:
+        char = line[i]
+        if char in " \t\r\n":
+            i += 1
+        elif char == ";":
+            break
+        elif char in "()":
+            depth += 1 if char == "(" else -1
+            i += 1
+        elif char == '"':
+            i += 1
+            text = []
+            while i < length and line[i] != '"':
+                if line[i] == "\\" and i + 1 < length:
+                    i += 1
+                text.append(line[i])
+                i += 1
+            if i >= length:
+                raise ZoneFileError(f"line {lineno}: unterminated quoted string")
+            tokens.append("".join(text))
+            i += 1
+        else:
+            start = i
+            while i < length and line[i] not in ' \t\r\n;()"':
+                i += 1
+            tokens.append(line[start:i])
+    return tokens, depth
+
+
+def _logical_lines(
+    lines: Iterable[str],
+) -> Iterator[Tuple[int, bool, List[str]]]:
+    """Join parenthesized continuations; yield ``(lineno, indented, tokens)``."""
+    pending: List[str] = []
+    depth = 0
+    start, indented = 0, False
+    for lineno, line in enumerate(lines, 1):
+        tokens, change = _tokenize(line, lineno)
+        if depth == 0:
+            start, indented = lineno, line[:1] in (" ", "\t")
+        pending.extend(tokens)
+        depth += change
+        if depth < 0:
+            raise ZoneFileError(f"line {lineno}: unbalanced ')'")
+        if depth == 0 and pending:
+            yield start, indented, pending
+            pending = []
+    if depth:
+        raise ZoneFileError(f"line {start}: unbalanced '('")
+
+
+def _record_body(
+    record_type: str,
+    values: List[str],
+    origin: str,
+    domain: str,
+    lineno: int,
+) -> Dict[str, Any]:
+
+    def host(name: str) -> str:
+        fqdn = _fqdn(name, origin)
+        return "@" if fqdn == domain else fqdn
+
+    def need(count: int) -> None:
+        if len(values) < count:
+            raise ZoneFileError(f"line {lineno}: {record_type} needs {count} fields")
+
+    try:
+        if record_type == "TXT":
+            return {"data": "".join(values)}
+        if record_type == "MX":
+            need(2)
+            return {"priority": int(values[0]), "data": host(values[1])}
+        if record_type == "SRV":
+            need(4)
+            return {
+                "priority": int(values[0]),
+                "weight": int(values[1]),
+                "port": int(values[2]),
+                "data": host(values[3]),
+            }
+        if record_type == "CAA":
+            need(3)
+            return {"flags": int(values[0]), "tag": values[1], "data": values[2]}
+    except ValueError as err:
+        raise ZoneFileError(f"line {lineno}: {err}") from err
+    need(1)
+    if record_type in _HOST_TYPES:
+        return {"data": host(values[0])}
+    return {"data": " ".join(values)}
+
+
+def parse_zone(lines: Iterable[str], domain: str) -> Iterator[Dict[str, Any]]:
+    """Parse a zone file incrementally into ``domains.create_record`` bodies.
+
+    *lines* is consumed lazily, one logical record at a time.  Names are
+    made relative to *domain*; host names in the data become absolute
+    (``"@"`` for the apex).  Records of every type are yielded, including
+    ones DigitalOcean does not accept (see :data:`SUPPORTED_TYPES`).
+    Malformed input raises :class:`~pydo.exceptions.ZoneFileError`.
+    """
+    domain = domain.rstrip(".").lower() + "."
+    origin = domain
+    default_ttl: Optional[int] = None
+    owner: Optional[str] = None
+    for lineno, indented, tokens in _logical_lines(lines):
+        first = tokens[0]
+        if first.upper() == "$ORIGIN":
+            if len(tokens) < 2:
+                raise ZoneFileError(f"line {lineno}: $ORIGIN needs a name")
+            origin = _fqdn(tokens[1], origin)
+            continue
+        if first.upper() == "$TTL":
+            default_ttl = _parse_ttl(tokens[1]) if len(tokens) > 1 else None
+            if default_ttl is None:
+                raise ZoneFileError(f"line {lineno}: invalid $TTL")
+            continue
+        if first.startswith("$"):
+            raise ZoneFileError(f"line {lineno}: unsupported directive {first}")
+
+        if not indented:
+            owner = _fqdn(first, origin)
+            tokens = tokens[1:]
+        if owner is None:
+            raise ZoneFileError(f"line {lineno}: record without an owner name")
+
+        ttl = default_ttl
+        record_type = None
+        while tokens:
+            token = tokens[0]
+            parsed_ttl = _parse_ttl(token)
+            if parsed_ttl is not None:
+                ttl = parsed_ttl
+            elif token.upper() not in _CLASSES:
+                record_type = token.upper()
+                tokens = tokens[1:]
+                break
+            tokens = tokens[1:]
+        if record_type is None:
+            raise ZoneFileError(f"line {lineno}: missing record type")
+
+        body = {"type": record_type, "name": _relative(owner, domain)}
+        body.update(_record_body(record_type, tokens, origin, domain, lineno))
+        if ttl is not None:
+            body["ttl"] = ttl
+        yield body
+
+
+# ----------------------------------------------------------------------------
+# Import
+# ----------------------------------------------------------------------------
+
+
+class ImportResult:
+    """Outcome of :func:`import_zone`.
+
+    ``created`` counts records created; ``failed`` holds ``(record,
+    exception)`` pairs and ``skipped`` the records that were not sent
+    (SOA, apex NS and unsupported types).
+    """
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.failed: List[Tuple[Dict[str, Any], BaseException]] = []
+        self.skipped: List[Dict[str, Any]] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"ImportResult(created={self.created}, failed={len(self.failed)}, "
+            f"skipped={len(self.skipped)})"
+        )
+
+
+def _importable(record: Mapping[str, Any]) -> bool:
+    if record["type"] not in SUPPORTED_TYPES:
+        return False
+    # The apex NS records are created and managed by DigitalOcean.
+    return not (record["type"] == "NS" and record["name"] == "@")
+
+
+def import_zone(
+    client,
+    domain: str,
+    lines: Iterable[str],
+    *,
+    max_workers: int = 8,
+    window: Optional[int] = None,
+    limiter=None,
+) -> ImportResult:
+    """Create every record of a zone file in *domain*.
+
+    *lines* is parsed lazily and at most *window* records (default: twice
+    *max_workers*) are held in memory or in flight at once.  Failed creates
+    are collected rather than aborting the import.  *limiter* is an optional
+    :class:`~pydo.custom_policies.RateLimiter`.
+    """
+    window = window or max_workers * 2
+    result = ImportResult()
+    domain = domain.rstrip(".")
+
+    def create(record: Dict[str, Any]) -> None:
+        if limiter is not None:
+            limiter.acquire()
+        client.domains.create_record(domain, record)
+
+    def settle(done: Iterable[Any]) -> None:
+        for future in done:
+            record = in_flight.pop(future)
+            try:
+                future.result()
+            except AzureError as err:
+                result.failed.append((record, err))
+            else:
+                result.created += 1
+
+    in_flight: Dict[Any, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for record in parse_zone(lines, domain):
+            if not _importable(record):
+                result.skipped.append(record)
+                continue
+            if len(in_flight) >= window:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                settle(done)
+            in_flight[pool.submit(create, record)] = record
+        settle(wait(in_flight).done)
+    return result
+
+
+async def async_import_zone(
+    client,
+    domain: str,
+    lines: Iterable[str],
+    *,
+    max_concurrency: int = 8,
+    limiter=None,
+) -> ImportResult:
+    """Async variant of :func:`import_zone` for ``pydo.aio.Client``.
+
+    At most *max_concurrency* creates are in flight; parsing pauses until
+    one of them finishes.
+    """
+    result = ImportResult()
+    domain = domain.rstrip(".")
+    in_flight: Set["asyncio.Future[None]"] = set()
+
+    async def create(record: Dict[str, Any]) -> None:
+        if limiter is not None:
+            await limiter.acquire_async()
+        try:
+            await client.domains.create_record(domain, record)
+        except AzureError as err:
+            result.failed.append((record, err))
+        else:
+            result.created += 1
+
+    try:
+        for record in parse_zone(lines, domain):
+            if not _importable(record):
+                result.skipped.append(record)
+                continue
+            while len(in_flight) >= max_concurrency:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+            in_flight.add(asyncio.ensure_future(create(record)))
+        await asyncio.gather(*in_flight)
+    finally:
+        for task in in_flight:
+            task.cancel()
+    return result
@@ -19,3 +19,45 @@ class SSEStreamDecodeError(ValueError):
 
 class SSEStreamRetryExhaustedError(RuntimeError):
     """Raised when all retry attempts for an SSE stream have failed."""
+
+
+class ActionError(RuntimeError):
+    """Raised when a waited-on action finishes with status ``errored``.
+
+    The action as last returned by the API is available as ``action``.
+    """
+
+    def __init__(self, action: dict):
+        self.action = action
+        super().__init__(
+            f"{action.get('type', 'unknown')} action {action.get('id')} errored"
+        )
+
+
+class ResourceStateError(RuntimeError):
+    """Raised when a resource being waited on reaches a failed state.
+
+    The resource as last returned by the API is available as ``resource``.
+    """
+
+    def __init__(self, group: str, resource: dict, state: str):
+        self.group = group
+        self.resource = resource
+        self.state = state
+        super().__init__(f"{group} resource {resource.get('id')} is {state!r}")
+
+
+class FleetTimeoutError(TimeoutError):
+    """Raised when ``create_fleet(..., wait=True)`` runs out of time.
+
+    The :class:`~pydo.custom_bulk.FleetResult` gathered so far is available
+    as ``result``; its ``pending`` lists the actions still running.
+    """
+
+    def __init__(self, result):
+        self.result = result
+        super().__init__(f"{len(result.pending)} create actions still running")
+
+
+class ZoneFileError(ValueError):
+    """Raised when a BIND zone file cannot be parsed."""
@@ -0,0 +1,448 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the bulk operation helpers"""
+
+import json
+
+import pytest
+import requests
+import responses
+from aioresponses import CallbackResult, aioresponses
+from azure.core.exceptions import ServiceRequestError
+from responses import matchers
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_bulk import (
+    async_bulk_droplet_action,
+    async_create_fleet,
+    async_untag_resources,
+    bulk_droplet_action,
+    create_fleet,
+    plan_droplet_action,
+    tag_resources,
+)
+from pydo.custom_waiters import ACTION_POLL_INTERVALS
+from pydo.exceptions import ActionError, FleetTimeoutError
+
+SPEC = {"region": "nyc3", "size": "s-1vcpu-1gb", "image": "ubuntu-24-04-x64"}
+DROPLETS = [
+    {"id": 1, "tags": ["web", "prod"]},
+    {"id": 2, "tags": ["web", "prod"]},
+    {"id": 3, "tags": ["web"]},
+    {"id": 4, "tags": ["db", "prod"]},
+    {"id": 5, "tags": ["db"]},
+    {"id": 6, "tags": []},
+]
+
+
+def _created(names, first_id):
+    droplets = [{"id": first_id + i, "name": n} for i, n in enumerate(names)]
+    return {
+        "droplets": droplets,
+        "links": {
+            "actions": [
+                {"id": d["id"] * 100, "rel": "create", "href": "https://x"}
+                for d in droplets
+            ]
+        },
+    }
+
+
+@responses.activate
+def test_create_fleet_chunks_names(mock_client: Client, mock_client_url):
+    """Tests names are split into requests of at most ten"""
+
+    def callback(request):
+        names = json.loads(request.body)["names"]
+        first_id = int(names[0].split("-")[1]) + 1
+        return 202, {}, json.dumps(_created(names, first_id))
+
+    responses.add_callback(
+        responses.POST, f"{mock_client_url}/v2/droplets", callback=callback
+    )
+
+    fleet = create_fleet(mock_client, [f"web-{i}" for i in range(25)], SPEC)
+
+    sizes = sorted(len(json.loads(c.request.body)["names"]) for c in responses.calls)
+    assert sizes == [5, 10, 10]
+    assert all(json.loads(c.request.body)["region"] == "nyc3" for c in responses.calls)
+    assert len(fleet.droplets) == 25
+    assert sorted(fleet.action_ids) == sorted(d["id"] * 100 for d in fleet.droplets)
+    assert not fleet.failed
+
+
+@responses.activate
+def test_create_fleet_reports_failed_chunks(mock_client: Client, mock_client_url):
+    """Tests a failed request is reported without losing the others"""
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets",
+        json=_created(["a", "b"], 1),
+        status=202,
+    )
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets",
+        json={"id": "unprocessable_entity", "message": "limit reached"},
+        status=422,
+    )
+
+    fleet = create_fleet(
+        mock_client, ["a", "b", "c"], SPEC, chunk_size=2, max_workers=1
+    )
+
+    assert [d["name"] for d in fleet.droplets] == ["a", "b"]
+    assert list(fleet.failed) == ["c"]
+    assert fleet.failed["c"].status_code == 422
+
+
+@responses.activate
+def test_create_fleet_waits_for_actions(
+    mock_client: Client, mock_client_url, monkeypatch
+):
+    """Tests wait=True resolves create actions and reports errored ones"""
+    monkeypatch.setitem(ACTION_POLL_INTERVALS, "create", 0.01)
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets",
+        json=_created(["a", "b"], 1),
+        status=202,
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json={
+            "actions": [
+                {"id": 200, "status": "errored", "type": "create", "resource_id": 2},
+                {"id": 100, "status": "completed", "type": "create", "resource_id": 1},
+            ],
+            "links": {"pages": {}},
+        },
+    )
+
+    fleet = create_fleet(mock_client, ["a", "b"], SPEC, wait=True, timeout=30)
+
+    assert list(fleet.failed) == ["b"]
+    assert isinstance(fleet.failed["b"], ActionError)
+
+
+@responses.activate
+def test_create_fleet_timeout_keeps_result(mock_client_url, monkeypatch):
+    """Tests a timed-out wait hands back the fleet and the running actions"""
+    monkeypatch.setitem(ACTION_POLL_INTERVALS, "create", 0.01)
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets",
+        json=_created(["a", "b"], 1),
+        status=202,
+    )
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets",
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json={
+            "actions": [
+                {"id": 200, "status": "in-progress", "type": "create"},
+                {"id": 100, "status": "completed", "type": "create"},
+            ],
+            "links": {"pages": {}},
+        },
+    )
+
+    with pytest.raises(FleetTimeoutError) as err:
+        create_fleet(
+            client,
+            ["a", "b", "c"],
+            SPEC,
+            chunk_size=2,
+            max_workers=1,
+            wait=True,
+            timeout=0.2,
+        )
+
+    fleet = err.value.result
+    assert [d["name"] for d in fleet.droplets] == ["a", "b"]
+    assert isinstance(fleet.failed["c"], ServiceRequestError)
+    assert fleet.pending == [200]
+
+
+def test_create_fleet_validates_input(mock_client: Client):
+    """Tests names must be unique and kept out of the shared body"""
+    with pytest.raises(ValueError):
+        create_fleet(mock_client, ["a", "a"], SPEC)
+    with pytest.raises(ValueError):
+        create_fleet(mock_client, ["a"], dict(SPEC, name="x"))
+
+
+@pytest.mark.asyncio
+async def test_async_create_fleet(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async helper chunks names and gathers the droplets"""
+
+    def callback(_, **kwargs):
+        names = json.loads(kwargs["data"])["names"]
+        return CallbackResult(status=202, payload=_created(names, len(names)))
+
+    with aioresponses() as mock_resp:
+        mock_resp.post(f"{mock_client_url}/v2/droplets", callback=callback, repeat=True)
+        fleet = await async_create_fleet(
+            mock_aio_client, [f"db-{i}" for i in range(12)], SPEC
+        )
+
+    assert sorted(d["name"] for d in fleet.droplets) == sorted(
+        f"db-{i}" for i in range(12)
+    )
+    assert len(fleet.actions) == 12
+
+
+def test_plan_uses_tags_fully_inside_the_target_set():
+    """Tests only tags whose Droplets are all targeted are used"""
+    assert plan_droplet_action([1, 2, 3, 6], DROPLETS, "power_cycle") == (
+        ["web"],
+        [6],
+    )
+    assert plan_droplet_action([1, 2, 3, 4, 5], DROPLETS, "power_cycle") == (
+        ["web", "db"],
+        [],
+    )
+    assert plan_droplet_action([1, 2, 3], DROPLETS, "rename") == ([], [1, 2, 3])
+
+
+@responses.activate
+def test_bulk_action_mixes_tag_and_per_id_posts(mock_client: Client, mock_client_url):
+    """Tests a covering tag is used once and the rest are posted per ID"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets",
+        json={"droplets": DROPLETS, "links": {"pages": {}}, "meta": {"total": 6}},
+    )
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets/actions",
+        json={"actions": [{"id": 11, "resource_id": i} for i in (1, 2, 3)]},
+        status=201,
+        match=[matchers.query_param_matcher({"tag_name": "web"})],
+    )
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets/6/actions",
+        json={"action": {"id": 16, "resource_id": 6}},
+        status=201,
+    )
+
+    result = bulk_droplet_action(mock_client, [1, 2, 3, 6], "power_cycle")
+
+    assert result.tags == ["web"]
+    assert sorted(a["resource_id"] for a in result.actions) == [1, 2, 3, 6]
+    assert result.requests == 2
+    assert not result.failed
+
+
+@responses.activate
+def test_bulk_action_falls_back_when_tag_post_fails(
+    mock_client: Client, mock_client_url
+):
+    """Tests a failed tag-targeted post is retried per Droplet"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets",
+        json={"droplets": DROPLETS[3:5], "links": {"pages": {}}, "meta": {"total": 2}},
+        match=[
+            matchers.query_param_matcher({"tag_name": "db", "per_page": 200, "page": 1})
+        ],
+    )
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets/actions",
+        json={"id": "forbidden", "message": "tag:read scope required"},
+        status=403,
+    )
+    for droplet_id in (4, 5):
+        responses.add(
+            responses.POST,
+            f"{mock_client_url}/v2/droplets/{droplet_id}/actions",
+            json={"action": {"id": droplet_id * 10, "resource_id": droplet_id}},
+            status=201,
+        )
+
+    result = bulk_droplet_action(mock_client, [4, 5], "shutdown", droplets=DROPLETS)
+
+    assert sorted(result.action_ids) == [40, 50]
+    assert not result.tags
+    assert result.requests == 3
+
+
+@responses.activate
+def test_bulk_action_checks_tag_members_outside_the_list(
+    mock_client: Client, mock_client_url
+):
+    """Tests a tag with members missing from a supplied list is not used"""
+    outsider = {"id": 9, "tags": ["web"]}
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets",
+        json={
+            "droplets": DROPLETS[:3] + [outsider],
+            "links": {"pages": {}},
+            "meta": {"total": 4},
+        },
+        match=[
+            matchers.query_param_matcher(
+                {"tag_name": "web", "per_page": 200, "page": 1}
+            )
+        ],
+    )
+    for droplet_id in (1, 2, 3):
+        responses.add(
+            responses.POST,
+            f"{mock_client_url}/v2/droplets/{droplet_id}/actions",
+            json={"action": {"id": droplet_id * 10, "resource_id": droplet_id}},
+            status=201,
+        )
+
+    result = bulk_droplet_action(
+        mock_client, [1, 2, 3], "power_off", droplets=DROPLETS[:3]
+    )
+
+    assert not result.tags
+    assert sorted(result.action_ids) == [10, 20, 30]
+    assert not any("tag_name=web" in c.request.url for c in responses.calls[1:])
+
+
+@responses.activate
+def test_bulk_action_reports_connection_errors(mock_client_url):
+    """Tests a dropped connection fails one target and keeps the others"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+    for droplet_id in (1, 2, 3):
+        responses.add(
+            responses.POST,
+            f"{mock_client_url}/v2/droplets/{droplet_id}/actions",
+            json={"action": {"id": droplet_id * 10, "resource_id": droplet_id}},
+            status=201,
+        )
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/droplets/4/actions",
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+
+    result = bulk_droplet_action(client, [1, 2, 3, 4], "reboot")
+
+    assert sorted(result.action_ids) == [10, 20, 30]
+    assert isinstance(result.failed[4], ServiceRequestError)
+    assert result.requests == 4
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_action(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async executor posts per ID for non-tag actions"""
+    with aioresponses() as mock_resp:
+        for droplet_id in (1, 2):
+            mock_resp.post(
+                f"{mock_client_url}/v2/droplets/{droplet_id}/actions",
+                status=201,
+                payload={"action": {"id": droplet_id, "type": "reboot"}},
+            )
+        mock_resp.post(
+            f"{mock_client_url}/v2/droplets/3/actions",
+            status=422,
+            payload={"id": "unprocessable_entity", "message": "locked"},
+        )
+
+        result = await async_bulk_droplet_action(
+            mock_aio_client, [1, 2, 3], {"type": "reboot"}
+        )
+
+    assert sorted(result.action_ids) == [1, 2]
+    assert list(result.failed) == [3]
+
+
+@responses.activate
+def test_tag_resources_retries_failed_chunks(mock_client: Client, mock_client_url):
+    """Tests chunks are sent concurrently and failed ones retried per resource"""
+
+    def assign(request):
+        resources = json.loads(request.body)["resources"]
+        if {"resource_id": "3", "resource_type": "droplet"} in resources:
+            return (403, {}, json.dumps({"id": "forbidden", "message": "no"}))
+        return (204, {}, "")
+
+    responses.add_callback(
+        responses.POST, f"{mock_client_url}/v2/tags/migrated/resources", assign
+    )
+    resources = [f"do:droplet:{i}" for i in range(1, 6)]
+    resources.append({"resource_id": "vol-1", "resource_type": "volume"})
+
+    result = tag_resources(mock_client, "migrated", resources, chunk_size=2)
+
+    assert list(result.failed) == ["do:droplet:3"]
+    assert result.succeeded == [
+        "do:droplet:1",
+        "do:droplet:2",
+        "do:droplet:4",
+        "do:droplet:5",
+        "do:volume:vol-1",
+    ]
+    # Three chunks, then the failed chunk once per resource.
+    assert result.requests == 5
+
+
+@responses.activate
+def test_tag_resources_reports_connection_errors(mock_client_url):
+    """Tests a dropped connection fails its chunk and keeps the other outcomes"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+
+    def assign(request):
+        resources = json.loads(request.body)["resources"]
+        if {"resource_id": "3", "resource_type": "droplet"} in resources:
+            raise requests.exceptions.ConnectionError("connection reset")
+        return (204, {}, "")
+
+    responses.add_callback(
+        responses.POST, f"{mock_client_url}/v2/tags/migrated/resources", assign
+    )
+    resources = [f"do:droplet:{i}" for i in range(1, 6)]
+
+    result = tag_resources(client, "migrated", resources, chunk_size=2)
+
+    assert result.succeeded == ["do:droplet:1", "do:droplet:2", "do:droplet:5"]
+    assert sorted(result.failed) == ["do:droplet:3", "do:droplet:4"]
+    assert isinstance(result.failed["do:droplet:3"], ServiceRequestError)
+    assert result.requests == 3
+
+
+def test_tag_resources_rejects_bad_urns(mock_client: Client):
+    """Tests malformed resource URNs are rejected before any call"""
+    with pytest.raises(ValueError):
+        tag_resources(mock_client, "migrated", ["droplet-1"])
+
+
+@pytest.mark.asyncio
+async def test_async_untag_resources(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async helper retries a failed chunk per resource"""
+    url = f"{mock_client_url}/v2/tags/migrated/resources"
+    bodies = []
+
+    def unassign(_url, **kwargs):
+        resources = json.loads(kwargs["data"])["resources"]
+        bodies.append(resources)
+        if len(resources) > 1:
+            return CallbackResult(status=422, payload={"id": "unprocessable_entity"})
+        if resources[0]["resource_id"] == "2":
+            return CallbackResult(status=403, payload={"id": "forbidden"})
+        return CallbackResult(status=204)
+
+    with aioresponses() as mock_resp:
+        mock_resp.delete(url, callback=unassign, repeat=True)
+        result = await async_untag_resources(
+            mock_aio_client, "migrated", ["do:droplet:1", "do:droplet:2"]
+        )
+
+    assert result.succeeded == ["do:droplet:1"]
+    assert list(result.failed) == ["do:droplet:2"]
+    assert len(bodies) == 3
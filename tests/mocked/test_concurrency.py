@@ -0,0 +1,192 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the adaptive concurrency limiter"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from aioresponses import aioresponses
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_concurrency import AdaptiveLimiter
+from pydo.custom_policies import (
+    AdaptiveConcurrencyPolicy,
+    AsyncAdaptiveConcurrencyPolicy,
+)
+
+DROPLET = {"droplet": {"id": 1, "name": "web-1", "status": "active"}}
+
+
+def test_window_grows_additively():
+    """Tests a full window of healthy responses adds about one slot"""
+    limiter = AdaptiveLimiter(initial=4)
+
+    for _ in range(4):
+        limiter.release(limiter.acquire())
+
+    assert limiter.limit == 4
+    limiter.release(limiter.acquire())
+    assert limiter.limit == 5
+
+
+def test_window_cut_once_per_burst_of_throttling():
+    """Tests 429s from requests started before the cut do not cut again"""
+    limiter = AdaptiveLimiter(initial=8)
+    started = [limiter.acquire() for _ in range(8)]
+
+    for start in started:
+        limiter.release(start, status=429)
+
+    assert limiter.limit == 4
+    assert limiter.throttled == 8
+
+    limiter.release(limiter.acquire(), status=503)
+    assert limiter.limit == 2
+
+
+def test_window_respects_bounds_and_failures():
+    """Tests the window stays within bounds and ignores non-throttle errors"""
+    limiter = AdaptiveLimiter(initial=2, min_limit=2, max_limit=2)
+
+    limiter.release(limiter.acquire(), status=429)
+    assert limiter.limit == 2
+    for _ in range(10):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 2
+
+    limiter.release(limiter.acquire(), status=500)
+    assert limiter.stats()["failed"] == 1
+
+
+def test_slow_responses_hold_the_window():
+    """Tests responses slower than latency_target do not grow the window"""
+    limiter = AdaptiveLimiter(initial=1, latency_target=0.0)
+
+    for _ in range(5):
+        limiter.release(limiter.acquire() - 1)
+
+    assert limiter.limit == 1
+
+
+def test_acquire_times_out_when_full():
+    """Tests acquire gives up once the timeout passes"""
+    limiter = AdaptiveLimiter(initial=1)
+    limiter.acquire()
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.01)
+
+
+def test_slot_reports_status_from_errors():
+    """Tests errors carrying a status code cut the window"""
+
+    class Throttled(Exception):
+        """Error carrying a 429 status code."""
+
+        status_code = 429
+
+    limiter = AdaptiveLimiter(initial=4)
+    with pytest.raises(Throttled):
+        with limiter.slot():
+            raise Throttled()
+
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+@responses.activate
+def test_policy_caps_in_flight_requests(mock_client_url):
+    """Tests threads beyond the window wait for a free slot"""
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    client = Client(
+        "",
+        endpoint=mock_client_url,
+        per_retry_policies=[AdaptiveConcurrencyPolicy(limiter)],
+    )
+    peak = []
+    lock = threading.Lock()
+
+    def callback(_):
+        with lock:
+            peak.append(limiter.in_flight)
+        return 200, {}, '{"droplet": {"id": 1}}'
+
+    responses.add_callback(
+        responses.GET, f"{mock_client_url}/v2/droplets/1", callback=callback
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: client.droplets.get(1), range(16)))
+
+    assert max(peak) <= 2
+    assert limiter.stats()["completed"] == 16
+    assert limiter.in_flight == 0
+
+
+@responses.activate
+def test_policy_cuts_window_on_429(mock_client_url):
+    """Tests a throttled attempt halves the window before the retry"""
+    limiter = AdaptiveLimiter(initial=8)
+    client = Client(
+        "",
+        endpoint=mock_client_url,
+        retry_backoff_factor=0,
+        per_retry_policies=[AdaptiveConcurrencyPolicy(limiter)],
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets/1",
+        status=429,
+        json={"id": "too_many_requests", "message": "slow down"},
+        headers={"retry-after": "0"},
+    )
+    responses.add(responses.GET, f"{mock_client_url}/v2/droplets/1", json=DROPLET)
+
+    assert client.droplets.get(1) == DROPLET
+    assert limiter.throttled == 1
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_async_policy_limits_gather(mock_client_url):
+    """Tests the async policy shares the window across gathered tasks"""
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+
+    async with aioClient(
+        "",
+        endpoint=mock_client_url,
+        per_retry_policies=[AsyncAdaptiveConcurrencyPolicy(limiter)],
+    ) as client:
+        with aioresponses() as mock_resp:
+            mock_resp.get(
+                f"{mock_client_url}/v2/droplets/1",
+                status=200,
+                payload=DROPLET,
+                repeat=True,
+            )
+            results = await asyncio.gather(*(client.droplets.get(1) for _ in range(6)))
+
+    assert results == [DROPLET] * 6
+    assert limiter.in_flight == 0
+    assert limiter.stats()["completed"] == 6
+
+
+@pytest.mark.asyncio
+async def test_async_waiter_cancellation_frees_its_turn():
+    """Tests a cancelled waiter does not block the next one"""
+    limiter = AdaptiveLimiter(initial=1)
+    held = await limiter.acquire_async()
+
+    first = asyncio.ensure_future(limiter.acquire_async())
+    second = asyncio.ensure_future(limiter.acquire_async())
+    await asyncio.sleep(0)
+    first.cancel()
+    limiter.release(held)
+
+    started = await asyncio.wait_for(second, 1)
+    assert started > 0
+    assert first.cancelled()
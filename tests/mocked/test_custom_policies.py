@@ -0,0 +1,548 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the opt-in pipeline policies"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from aioresponses import CallbackResult, aioresponses
+from azure.core.pipeline import PipelineResponse
+from responses import matchers
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_cache import CachedResponse, MemoryCacheBackend, SqliteCacheBackend
+from pydo.custom_policies import (
+    AsyncResponseCachePolicy,
+    AsyncRateLimitPolicy,
+    AsyncRateLimitRetryPolicy,
+    AsyncSingleFlightPolicy,
+    ConditionalRequestPolicy,
+    RateLimiter,
+    RateLimitPolicy,
+    RateLimitRetryPolicy,
+    ResponseCachePolicy,
+    SingleFlightPolicy,
+)
+
+DROPLET = {"droplet": {"id": 1, "name": "web-1", "status": "active"}}
+SIZES = {"sizes": [{"slug": "s-1vcpu-1gb"}], "links": {}, "meta": {"total": 1}}
+
+
+@responses.activate
+def test_conditional_request_revalidates(mock_client_url):
+    """Tests a 304 answer is served from the stored response"""
+    policy = ConditionalRequestPolicy()
+    client = Client("", endpoint=mock_client_url, per_call_policies=[policy])
+    url = f"{mock_client_url}/v2/droplets/1"
+
+    responses.add(responses.GET, url, json=DROPLET, headers={"ETag": '"v1"'})
+    responses.add(
+        responses.GET,
+        url,
+        status=304,
+        match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+
+    assert client.droplets.get(1) == DROPLET
+    assert client.droplets.get(1) == DROPLET
+    assert (policy.hits, policy.misses) == (1, 1)
+
+
+@responses.activate
+def test_conditional_request_skips_unvalidated(mock_client_url):
+    """Tests responses without validators are never revalidated"""
+    policy = ConditionalRequestPolicy()
+    client = Client("", endpoint=mock_client_url, per_call_policies=[policy])
+    url = f"{mock_client_url}/v2/droplets/1"
+
+    responses.add(responses.GET, url, json=DROPLET)
+
+    client.droplets.get(1)
+    client.droplets.get(1)
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert policy.hits == 0
+
+
+@responses.activate
+def test_conditional_request_scoped_by_credential(mock_client_url):
+    """Tests one token's validators are never sent for another token"""
+    url = f"{mock_client_url}/v2/droplets/1"
+    responses.add(responses.GET, url, json=DROPLET, headers={"ETag": '"v1"'})
+    policy_a = ConditionalRequestPolicy(credential="token-a")
+    policy_b = ConditionalRequestPolicy(credential="token-b")
+    policy_b._entries = policy_a._entries  # pylint: disable=protected-access
+
+    for token, policy in (("token-a", policy_a), ("token-b", policy_b)):
+        client = Client(token, endpoint=mock_client_url, per_call_policies=[policy])
+        assert client.droplets.get(1) == DROPLET
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert len(policy_a._entries) == 2  # pylint: disable=protected-access
+
+
+@responses.activate
+def test_conditional_request_invalidate(mock_client_url):
+    """Tests invalidate() drops the stored validators"""
+    policy = ConditionalRequestPolicy()
+    client = Client("", endpoint=mock_client_url, per_call_policies=[policy])
+    url = f"{mock_client_url}/v2/droplets/1"
+
+    responses.add(responses.GET, url, json=DROPLET, headers={"ETag": '"v1"'})
+
+    client.droplets.get(1)
+    policy.invalidate()
+    client.droplets.get(1)
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+
+
+@pytest.mark.asyncio
+async def test_conditional_request_async(mock_client_url):
+    """Tests the policy with the aio client"""
+    policy = ConditionalRequestPolicy()
+    url = f"{mock_client_url}/v2/droplets/1"
+
+    def answer(_, **kwargs):
+        if kwargs["headers"].get("If-None-Match") == '"v1"':
+            return CallbackResult(status=304)
+        return CallbackResult(status=200, payload=DROPLET, headers={"ETag": '"v1"'})
+
+    async with aioClient(
+        "", endpoint=mock_client_url, per_call_policies=[policy]
+    ) as client:
+        with aioresponses() as mock_resp:
+            mock_resp.get(url, callback=answer, repeat=True)
+
+            assert await client.droplets.get(1) == DROPLET
+            assert await client.droplets.get(1) == DROPLET
+
+    assert policy.hits == 1
+
+
+@responses.activate
+def test_response_cache_serves_catalog_endpoints(mock_client_url):
+    """Tests catalog GETs are cached and other GETs are not"""
+    cache = ResponseCachePolicy()
+    client = Client("", endpoint=mock_client_url, per_call_policies=[cache])
+
+    responses.add(responses.GET, f"{mock_client_url}/v2/sizes", json=SIZES)
+    responses.add(responses.GET, f"{mock_client_url}/v2/droplets/1", json=DROPLET)
+
+    assert client.sizes.list() == SIZES
+    assert client.sizes.list() == SIZES
+    client.droplets.get(1)
+    client.droplets.get(1)
+
+    assert len(responses.calls) == 3
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@responses.activate
+def test_response_cache_matches_query_conditions(mock_client_url):
+    """Tests only distribution image listings are cached by default"""
+    cache = ResponseCachePolicy()
+    client = Client("", endpoint=mock_client_url, per_call_policies=[cache])
+
+    responses.add(
+        responses.GET, f"{mock_client_url}/v2/images", json={"images": [], "links": {}}
+    )
+
+    client.images.list(type="distribution")
+    client.images.list(type="distribution")
+    client.images.list(private=True)
+    client.images.list(private=True)
+
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_response_cache_ttl_and_invalidate(mock_client_url):
+    """Tests custom TTLs, LRU eviction and explicit invalidation"""
+    cache = ResponseCachePolicy(ttls={"/v2/regions": 0, "/v2/sizes": 60}, max_entries=1)
+    client = Client("", endpoint=mock_client_url, per_call_policies=[cache])
+
+    responses.add(responses.GET, f"{mock_client_url}/v2/regions", json={"regions": []})
+    responses.add(responses.GET, f"{mock_client_url}/v2/sizes", json=SIZES)
+
+    client.regions.list()
+    client.regions.list()
+    assert len(responses.calls) == 2
+
+    client.sizes.list()
+    cache.invalidate("/v2/sizes")
+    client.sizes.list()
+    assert len(responses.calls) == 4
+    assert len(cache.backend) == 1
+
+
+@responses.activate
+def test_response_cache_scoped_by_credential(mock_client_url):
+    """Tests a shared backend never serves one token's entries to another"""
+    backend = MemoryCacheBackend()
+    responses.add(responses.GET, f"{mock_client_url}/v2/sizes", json=SIZES)
+
+    for token in ("token-a", "token-b", "token-a"):
+        cache = ResponseCachePolicy(backend=backend, credential=token)
+        client = Client(token, endpoint=mock_client_url, per_call_policies=[cache])
+        assert client.sizes.list() == SIZES
+
+    assert len(responses.calls) == 2
+    assert len(backend) == 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_async(mock_client_url):
+    """Tests the async cache policy with the aio client"""
+    cache = AsyncResponseCachePolicy()
+
+    async with aioClient(
+        "", endpoint=mock_client_url, per_call_policies=[cache]
+    ) as client:
+        with aioresponses() as mock_resp:
+            mock_resp.get(
+                f"{mock_client_url}/v2/sizes?page=1&per_page=20",
+                status=200,
+                payload=SIZES,
+            )
+
+            assert await client.sizes.list() == SIZES
+            assert await client.sizes.list() == SIZES
+
+    assert cache.hits == 1
+
+
+@responses.activate
+def test_sqlite_cache_shared_between_clients(mock_client_url, tmp_path):
+    """Tests a cold client answers from a cache file written by another"""
+    path = str(tmp_path / "cache.sqlite3")
+    responses.add(responses.GET, f"{mock_client_url}/v2/sizes", json=SIZES)
+
+    for token in ("token-a", "token-b"):
+        backend = SqliteCacheBackend(path, credential=token)
+        first = Client(
+            token,
+            endpoint=mock_client_url,
+            per_call_policies=[ResponseCachePolicy(backend=backend)],
+        )
+        assert first.sizes.list() == SIZES
+
+    cache = ResponseCachePolicy(backend=SqliteCacheBackend(path, credential="token-a"))
+    second = Client("token-a", endpoint=mock_client_url, per_call_policies=[cache])
+    assert second.sizes.list() == SIZES
+
+    assert len(responses.calls) == 2
+    assert cache.hits == 1
+
+
+def test_sqlite_cache_requires_namespace(tmp_path):
+    """Tests a backend without namespace or credential is refused"""
+    with pytest.raises(ValueError):
+        SqliteCacheBackend(str(tmp_path / "cache.sqlite3"))
+
+
+def test_sqlite_cache_reads_while_locked(tmp_path):
+    """Tests lookups succeed while another connection holds the write lock"""
+    path = str(tmp_path / "cache.sqlite3")
+    backend = SqliteCacheBackend(path, namespace="", timeout=0.1)
+    url = "https://api.digitalocean.com/v2/sizes"
+    backend.set(url, CachedResponse(200, {}, b"{}"), 60)
+
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        for _ in range(100):
+            assert backend.get(url).json() == {}
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+
+def test_sqlite_cache_caps_and_invalidation(tmp_path):
+    """Tests entry caps evict the least recently read entry"""
+    backend = SqliteCacheBackend(
+        str(tmp_path / "cache.sqlite3"), max_entries=2, namespace="test:"
+    )
+    for name in ("regions", "sizes", "images"):
+        backend.set(
+            f"https://api.digitalocean.com/v2/{name}",
+            CachedResponse(200, {"Content-Type": "application/json"}, b"{}"),
+            60,
+        )
+
+    assert len(backend) == 2
+    assert backend.get("https://api.digitalocean.com/v2/regions") is None
+    assert backend.get("https://api.digitalocean.com/v2/sizes").json() == {}
+
+    backend.invalidate("/v2/images")
+    assert len(backend) == 1
+
+    backend.set(
+        "https://api.digitalocean.com/v2/sizes", CachedResponse(200, {}, b""), 0
+    )
+    assert backend.get("https://api.digitalocean.com/v2/sizes") is None
+
+
+@responses.activate
+def test_single_flight_collapses_concurrent_gets(mock_client_url):
+    """Tests identical concurrent GETs share one HTTP call"""
+    policy = SingleFlightPolicy()
+    client = Client("", endpoint=mock_client_url, per_call_policies=[policy])
+    started = threading.Event()
+
+    def slow_droplet(_):
+        started.set()
+        time.sleep(0.3)
+        return (200, {"Content-Type": "application/json"}, json.dumps(DROPLET))
+
+    responses.add_callback(
+        responses.GET, f"{mock_client_url}/v2/droplets/1", callback=slow_droplet
+    )
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        first = pool.submit(client.droplets.get, 1)
+        started.wait()
+        others = [pool.submit(client.droplets.get, 1) for _ in range(4)]
+        results = [first.result()] + [f.result() for f in others]
+
+    assert results == [DROPLET] * 5
+    assert len(responses.calls) == 1
+    assert policy.coalesced == 4
+
+
+@responses.activate
+def test_single_flight_keeps_tokens_apart(mock_client_url):
+    """Tests concurrent GETs made with different tokens are not coalesced"""
+    started = threading.Barrier(2, timeout=5)
+    policies = {}
+    clients = {}
+    for token in ("token-a", "token-b"):
+        policies[token] = SingleFlightPolicy(credential=token)
+        clients[token] = Client(
+            token, endpoint=mock_client_url, per_call_policies=[policies[token]]
+        )
+
+    def slow_droplet(request):
+        started.wait()
+        token = request.headers["Authorization"].split()[-1]
+        body = {"droplet": {"id": 1, "name": token}}
+        return (200, {"Content-Type": "application/json"}, json.dumps(body))
+
+    responses.add_callback(
+        responses.GET, f"{mock_client_url}/v2/droplets/1", callback=slow_droplet
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {t: pool.submit(c.droplets.get, 1) for t, c in clients.items()}
+        names = {t: f.result()["droplet"]["name"] for t, f in futures.items()}
+
+    assert names == {"token-a": "token-a", "token-b": "token-b"}
+    assert len(responses.calls) == 2
+    assert policies["token-a"].coalesced == policies["token-b"].coalesced == 0
+
+
+@responses.activate
+def test_single_flight_does_not_cache(mock_client_url):
+    """Tests sequential GETs are each sent once the previous one completes"""
+    policy = SingleFlightPolicy()
+    client = Client("", endpoint=mock_client_url, per_call_policies=[policy])
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets/2",
+        status=404,
+        json={"id": "not_found", "message": "The resource was not found."},
+    )
+
+    assert client.droplets.get(2)["id"] == "not_found"
+    assert client.droplets.get(2)["id"] == "not_found"
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight(mock_client_url):
+    """Tests identical concurrent aio GETs share one HTTP call"""
+    policy = AsyncSingleFlightPolicy()
+
+    async def slow_droplet(_, **__):
+        await asyncio.sleep(0.1)
+        return CallbackResult(status=200, payload=DROPLET)
+
+    async with aioClient(
+        "", endpoint=mock_client_url, per_call_policies=[policy]
+    ) as client:
+        with aioresponses() as mock_resp:
+            mock_resp.get(
+                f"{mock_client_url}/v2/droplets/1", callback=slow_droplet, repeat=True
+            )
+            results = await asyncio.gather(*(client.droplets.get(1) for _ in range(5)))
+
+            calls = sum(len(c) for c in mock_resp.requests.values())
+
+    assert calls == 1
+    assert results == [DROPLET] * 5
+    assert policy.coalesced == 4
+
+
+def test_rate_limiter_paces_after_burst():
+    """Tests tokens beyond the burst are spaced at the refill rate"""
+    limiter = RateLimiter(rate=10, max_rate=10, burst=2)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+    assert limiter.throttled == 2
+
+
+def test_rate_limiter_learns_from_headers():
+    """Tests the refill rate follows remaining budget over the reset window"""
+    limiter = RateLimiter(max_rate=100)
+
+    limiter.update(
+        {
+            "ratelimit-limit": "5000",
+            "ratelimit-remaining": "600",
+            "ratelimit-reset": str(time.time() + 60),
+        }
+    )
+
+    assert limiter.limit == 5000
+    assert limiter.rate == pytest.approx(10, rel=0.05)
+
+
+def test_rate_limiter_waits_for_reset_when_exhausted():
+    """Tests an exhausted budget delays requests until the reset time"""
+    limiter = RateLimiter()
+
+    limiter.update({"ratelimit-remaining": "0", "ratelimit-reset": time.time() + 30})
+
+    assert limiter.reserve() == pytest.approx(30, abs=1)
+
+
+@responses.activate
+def test_rate_limit_policy_updates_shared_limiter(mock_client_url):
+    """Tests the policy feeds response headers to the shared limiter"""
+    limiter = RateLimiter()
+    client = Client(
+        "", endpoint=mock_client_url, per_retry_policies=[RateLimitPolicy(limiter)]
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets/1",
+        json=DROPLET,
+        headers={
+            "ratelimit-limit": "5000",
+            "ratelimit-remaining": "4321",
+            "ratelimit-reset": str(int(time.time()) + 1800),
+        },
+    )
+
+    client.droplets.get(1)
+
+    assert limiter.remaining == 4321
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limit_policy(mock_client_url):
+    """Tests the async policy shares the same limiter type"""
+    limiter = RateLimiter()
+
+    async with aioClient(
+        "", endpoint=mock_client_url, per_retry_policies=[AsyncRateLimitPolicy(limiter)]
+    ) as client:
+        with aioresponses() as mock_resp:
+            mock_resp.get(
+                f"{mock_client_url}/v2/droplets/1",
+                status=200,
+                payload=DROPLET,
+                headers={"ratelimit-remaining": "99"},
+            )
+            await client.droplets.get(1)
+
+    assert limiter.remaining == 99
+
+
+@responses.activate
+def test_retry_policy_waits_for_ratelimit_reset(mock_client_url):
+    """Tests a 429 is retried after ratelimit-reset and counted"""
+    policy = RateLimitRetryPolicy(retry_jitter=0)
+    client = Client("", endpoint=mock_client_url, retry_policy=policy)
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets/1",
+        status=429,
+        json={"id": "too_many_requests", "message": "slow down"},
+        headers={"ratelimit-remaining": "0", "ratelimit-reset": str(time.time())},
+    )
+    responses.add(responses.GET, f"{mock_client_url}/v2/droplets/1", json=DROPLET)
+
+    assert client.droplets.get(1) == DROPLET
+    assert policy.retries == 1
+    assert policy.rate_limited_retries == 1
+    assert policy.slept < 1
+
+
+@responses.activate
+def test_retry_policy_retries_rate_limited_post(mock_client_url):
+    """Tests a rate limited POST is retried since it was never processed"""
+    policy = RateLimitRetryPolicy(retry_jitter=0)
+    client = Client("", endpoint=mock_client_url, retry_policy=policy)
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/tags",
+        status=429,
+        json={"id": "too_many_requests", "message": "slow down"},
+        headers={"retry-after": "0"},
+    )
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/tags",
+        status=201,
+        json={"tag": {"name": "web"}},
+    )
+
+    assert client.tags.create({"name": "web"}) == {"tag": {"name": "web"}}
+    assert len(responses.calls) == 2
+    assert policy.rate_limited_retries == 1
+
+
+def test_retry_policy_delay_from_reset_header():
+    """Tests the delay is the time until ratelimit-reset plus bounded jitter"""
+    policy = RateLimitRetryPolicy(retry_jitter=2)
+    response = CachedResponse(
+        429, {"ratelimit-reset": str(time.time() + 30)}, b"", reason="Too Many"
+    )
+
+    delay = policy.get_retry_after(PipelineResponse(None, response, None))
+
+    assert 29 <= delay <= 32.5
+    assert policy.slept == delay
+
+
+@pytest.mark.asyncio
+async def test_async_retry_policy_waits_for_ratelimit_reset(mock_client_url):
+    """Tests the async policy retries a 429 after ratelimit-reset"""
+    policy = AsyncRateLimitRetryPolicy(retry_jitter=0)
+
+    async with aioClient("", endpoint=mock_client_url, retry_policy=policy) as client:
+        with aioresponses() as mock_resp:
+            mock_resp.get(
+                f"{mock_client_url}/v2/droplets/1",
+                status=429,
+                payload={"id": "too_many_requests", "message": "slow down"},
+                headers={"ratelimit-reset": str(time.time())},
+            )
+            mock_resp.get(
+                f"{mock_client_url}/v2/droplets/1", status=200, payload=DROPLET
+            )
+            assert await client.droplets.get(1) == DROPLET
+
+    assert policy.rate_limited_retries == 1
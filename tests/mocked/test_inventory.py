@@ -0,0 +1,114 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the inventory snapshot helpers"""
+
+import pytest
+import responses
+from aioresponses import aioresponses
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_inventory import (
+    InventorySnapshot,
+    async_collect_inventory,
+    collect_inventory,
+)
+
+DROPLETS = [
+    {
+        "id": 1,
+        "name": "web-1",
+        "tags": ["web"],
+        "region": {"slug": "nyc3"},
+        "vpc_uuid": "vpc-1",
+    },
+    {
+        "id": 2,
+        "name": "db-1",
+        "tags": ["db"],
+        "region": {"slug": "sfo3"},
+        "vpc_uuid": "vpc-2",
+    },
+]
+VOLUMES = [{"id": "vol-1", "name": "data", "tags": ["web"], "region": {"slug": "nyc3"}}]
+DOMAINS = [{"name": "example.com", "ttl": 1800}]
+RECORDS = [{"id": 10, "type": "A", "name": "www", "data": "1.2.3.4"}]
+
+
+def _register(mock_client_url):
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/droplets",
+        json={"droplets": DROPLETS, "links": {}, "meta": {"total": 2}},
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/volumes",
+        json={"volumes": VOLUMES, "links": {}, "meta": {"total": 1}},
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/domains",
+        json={"domains": DOMAINS, "links": {}, "meta": {"total": 1}},
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/domains/example.com/records",
+        json={"domain_records": RECORDS, "links": {}, "meta": {"total": 1}},
+    )
+
+
+@responses.activate
+def test_collect_inventory(mock_client: Client, mock_client_url):
+    """Tests collecting several kinds plus domain records into one snapshot"""
+    _register(mock_client_url)
+
+    inventory = collect_inventory(
+        mock_client, ["droplets", "volumes", "domain_records"], max_workers=4
+    )
+
+    assert inventory.kinds() == ["droplets", "volumes", "domains", "domain_records"]
+    assert inventory["droplets"] == DROPLETS
+    assert inventory.by_id("droplets", 2)["name"] == "db-1"
+    assert inventory.by_id("domains", "example.com") == DOMAINS[0]
+    assert inventory.records_for("example.com") == RECORDS
+    assert inventory.by_tag("web") == {"droplets": [DROPLETS[0]], "volumes": VOLUMES}
+    assert inventory.by_region("sfo3") == {"droplets": [DROPLETS[1]]}
+    assert inventory.by_vpc("vpc-1") == {"droplets": [DROPLETS[0]]}
+
+
+def test_collect_inventory_rejects_unknown_kinds(mock_client: Client):
+    """Tests that typos in kinds fail before any request is made"""
+    with pytest.raises(ValueError):
+        collect_inventory(mock_client, ["droplet"])
+
+
+def test_snapshot_indexes_by_name():
+    """Tests name lookups return every match"""
+    inventory = InventorySnapshot(
+        {"vpcs": [{"id": "v1", "name": "default"}, {"id": "v2", "name": "default"}]}
+    )
+
+    assert [v["id"] for v in inventory.by_name("vpcs", "default")] == ["v1", "v2"]
+    assert inventory.by_vpc("v2") == {"vpcs": [{"id": "v2", "name": "default"}]}
+
+
+@pytest.mark.asyncio
+async def test_async_collect_inventory(mock_aio_client: aioClient, mock_client_url):
+    """Tests the aio inventory collector"""
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            f"{mock_client_url}/v2/domains?page=1&per_page=200",
+            status=200,
+            payload={"domains": DOMAINS, "links": {}, "meta": {"total": 1}},
+        )
+        mock_resp.get(
+            f"{mock_client_url}/v2/domains/example.com/records?page=1&per_page=200",
+            status=200,
+            payload={"domain_records": RECORDS, "links": {}, "meta": {"total": 1}},
+        )
+
+        inventory = await async_collect_inventory(mock_aio_client, ["domain_records"])
+
+    assert inventory["domains"] == DOMAINS
+    assert inventory["domain_records"] == RECORDS
@@ -0,0 +1,243 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the App Platform log streaming helpers"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+from aiohttp.test_utils import TestServer
+from aiohttp.web import Application, WebSocketResponse
+from aioresponses import aioresponses
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo import custom_logs
+from pydo.custom_logs import (
+    LogLine,
+    async_iter_app_logs,
+    async_iter_url_lines,
+    iter_app_logs,
+    iter_url_lines,
+)
+
+LOGS = {
+    "/web/1": b"web one\nweb two\n",
+    "/web/2": b"web three\r\nno newline",
+    "/worker/1": b"worker one\n",
+}
+
+
+class _LogHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serves LOGS, chunked so lines arrive across reads."""
+        if self.path == "/live":
+            self._serve_live()
+            return
+        body = LOGS.get(self.path)
+        if body is None:
+            self.send_error(403)
+            return
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(0, len(body), 5):
+            chunk = body[i : i + 5]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _serve_live(self):
+        """Sends two lines with a pause between them, then stays silent until
+        the server is released."""
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in (b"live one\n", b"live two\n"):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+            self.wfile.flush()
+            if self.server.release.wait(0.3):
+                return
+        self.server.release.wait(5)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="log_server")
+def fixture_log_server():
+    """Serves LOGS on a local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LogHandler)
+    server.release = threading.Event()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_iter_url_lines(log_server):
+    """Tests a log URL is read line by line"""
+    assert list(iter_url_lines(f"{log_server}/web/2")) == ["web three", "no newline"]
+
+
+def test_iter_url_lines_rejects_websockets():
+    """Tests a WebSocket URL points to the async API"""
+    with pytest.raises(ValueError, match="async_iter_url_lines"):
+        next(iter_url_lines("wss://logs.local/live"))
+
+
+@responses.activate
+def test_iter_app_logs_reads_components(
+    mock_client: Client, mock_client_url, log_server
+):
+    """Tests every component's URLs are read and failures reported"""
+    base = f"{mock_client_url}/v2/apps/app-1/components"
+    responses.add(
+        responses.GET,
+        f"{base}/web/logs",
+        json={"historic_urls": [f"{log_server}/web/1", f"{log_server}/web/2"]},
+    )
+    responses.add(
+        responses.GET,
+        f"{base}/worker/logs",
+        json={
+            "historic_urls": [f"{log_server}/worker/1"],
+            "live_url": f"{log_server}/missing",
+        },
+    )
+    errors = []
+
+    lines = list(
+        iter_app_logs(
+            mock_client,
+            "app-1",
+            ["web", "worker"],
+            follow=True,
+            on_error=lambda component, err: errors.append(component),
+        )
+    )
+
+    web = [line.text for line in lines if line.component == "web"]
+    assert sorted(web) == ["no newline", "web one", "web three", "web two"]
+    assert web.index("web one") < web.index("web two")
+    assert LogLine("worker", "worker one", False) in lines
+    assert errors == ["worker"]
+    assert responses.calls[0].request.params["follow"] == "true"
+
+
+@responses.activate
+def test_iter_app_logs_raises_without_on_error(
+    mock_client: Client, mock_client_url, log_server
+):
+    """Tests a failing URL is raised when no error handler is given"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/apps/app-1/logs",
+        json={"historic_urls": [f"{log_server}/missing"]},
+    )
+
+    with pytest.raises(Exception, match="403"):
+        list(iter_app_logs(mock_client, "app-1"))
+
+
+@responses.activate
+def test_iter_app_logs_stops_silent_live_readers(
+    mock_client: Client, mock_client_url, log_server, monkeypatch
+):
+    """Tests live readers exit after the generator is closed"""
+    monkeypatch.setattr(custom_logs, "_LIVE_READ_TIMEOUT", 0.1)
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/apps/app-1/logs",
+        json={"live_url": f"{log_server}/live"},
+    )
+
+    lines = iter_app_logs(mock_client, "app-1", follow=True)
+    assert next(lines) == LogLine(None, "live one", True)
+    lines.close()
+
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and any(
+        thread.name == "pydo-live-log" for thread in threading.enumerate()
+    ):
+        time.sleep(0.05)
+    assert not any(thread.name == "pydo-live-log" for thread in threading.enumerate())
+
+
+@responses.activate
+def test_iter_app_logs_keeps_reading_a_silent_live_url(
+    mock_client: Client, mock_client_url, log_server, monkeypatch
+):
+    """Tests a live URL that goes quiet is read on, not reopened"""
+    monkeypatch.setattr(custom_logs, "_LIVE_READ_TIMEOUT", 0.1)
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/apps/app-1/logs",
+        json={"live_url": f"{log_server}/live"},
+    )
+
+    lines = iter_app_logs(mock_client, "app-1", follow=True)
+    try:
+        assert [next(lines).text, next(lines).text] == ["live one", "live two"]
+    finally:
+        lines.close()
+
+
+@pytest.mark.asyncio
+async def test_async_iter_url_lines_follows_websockets():
+    """Tests a WebSocket live URL is read message by message"""
+
+    async def live(request):
+        websocket = WebSocketResponse()
+        await websocket.prepare(request)
+        await websocket.send_str("one\ntwo")
+        await websocket.send_bytes(b"three\xc3\n")
+        await websocket.close()
+        return websocket
+
+    app = Application()
+    app.router.add_get("/live", live)
+    async with TestServer(app) as server:
+        url = str(server.make_url("/live")).replace("http://", "ws://")
+        lines = [line async for line in async_iter_url_lines(url)]
+
+    assert lines == ["one", "two", "three\ufffd"]
+
+
+@pytest.mark.asyncio
+async def test_async_iter_app_logs(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async generator streams historic and live URLs"""
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            f"{mock_client_url}/v2/apps/app-1/deployments/dep-1/components/web/logs"
+            "?follow=true&type=RUN",
+            status=200,
+            payload={
+                "historic_urls": ["https://logs.local/web/1"],
+                "live_url": "https://logs.local/web/live",
+            },
+        )
+        mock_resp.get("https://logs.local/web/1", status=200, body=b"a\nb\n")
+        mock_resp.get("https://logs.local/web/live", status=200, body=b"c\xc3")
+
+        lines = [
+            line
+            async for line in async_iter_app_logs(
+                mock_aio_client,
+                "app-1",
+                ["web"],
+                deployment_id="dep-1",
+                follow=True,
+            )
+        ]
+
+    assert sorted(lines) == [
+        LogLine("web", "a", False),
+        LogLine("web", "b", False),
+        LogLine("web", "c�", True),
+    ]
@@ -0,0 +1,328 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the monitoring metrics helpers"""
+
+import json
+import re
+
+import pytest
+import requests
+import responses
+from aioresponses import CallbackResult, aioresponses
+from azure.core.exceptions import ServiceRequestError
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_metrics import (
+    MemoryMetricStore,
+    MetricsResult,
+    SqliteMetricStore,
+    async_backfill_metrics,
+    async_fetch_droplet_metrics,
+    backfill_metrics,
+    combine_series,
+    decode_metrics,
+    decode_series,
+    fetch_droplet_metrics,
+    metric_chunks,
+    stitch_series,
+)
+
+numpy = pytest.importorskip("numpy")
+
+
+def _series(host_id, value, **labels):
+    return {
+        "status": "success",
+        "data": {
+            "resultType": "matrix",
+            "result": [
+                {
+                    "metric": dict(labels, host_id=host_id),
+                    "values": [[1700000000, value], [1700000060, value]],
+                }
+            ],
+        },
+    }
+
+
+@responses.activate
+def test_fetch_droplet_metrics_merges_by_host_and_kind(
+    mock_client: Client, mock_client_url
+):
+    """Tests one request per host and kind is merged into a single result"""
+    base = f"{mock_client_url}/v2/monitoring/metrics/droplet"
+
+    def metrics(request):
+        host = request.params["host_id"]
+        if host == "3":
+            return (403, {}, '{"id": "forbidden", "message": "no"}')
+        assert request.params["start"] == "1700000000"
+        assert request.params["end"] == "1700003600"
+        value = request.params.get("direction", "0.5")
+        return (200, {}, json.dumps(_series(host, value)))
+
+    responses.add_callback(responses.GET, f"{base}/cpu", metrics)
+    responses.add_callback(responses.GET, f"{base}/bandwidth", metrics)
+
+    result = fetch_droplet_metrics(
+        mock_client,
+        [1, 2, 3, 2],
+        ["cpu", "bandwidth_public_outbound"],
+        start=1700000000,
+        end=1700003600.5,
+    )
+
+    assert len(responses.calls) == 6
+    assert sorted(result.series) == [1, 2]
+    assert result.get(2, "cpu")[0]["values"][0] == [1700000000, "0.5"]
+    assert result.get(1, "bandwidth_public_outbound")[0]["values"][0][1] == "outbound"
+    assert sorted(result.failed) == [(3, "bandwidth_public_outbound"), (3, "cpu")]
+    assert result.get(3, "cpu") == []
+
+
+@responses.activate
+def test_fetch_droplet_metrics_reports_connection_errors(mock_client_url):
+    """Tests a dropped connection fails one request and keeps the others"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+
+    def metrics(request):
+        host = request.params["host_id"]
+        if host == "2":
+            raise requests.exceptions.ConnectionError("connection reset")
+        return (200, {}, json.dumps(_series(host, "0.5")))
+
+    responses.add_callback(
+        responses.GET, f"{mock_client_url}/v2/monitoring/metrics/droplet/cpu", metrics
+    )
+
+    result = fetch_droplet_metrics(client, [1, 2, 3], ["cpu"], start=0, end=60)
+
+    assert sorted(result.series) == [1, 3]
+    assert list(result.failed) == [(2, "cpu")]
+    assert isinstance(result.failed[(2, "cpu")], ServiceRequestError)
+
+
+def test_fetch_droplet_metrics_rejects_unknown_kinds(mock_client: Client):
+    """Tests unknown metric kinds are rejected before any request"""
+    with pytest.raises(ValueError, match="disk"):
+        fetch_droplet_metrics(mock_client, [1], ["cpu", "disk"], start=0)
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_droplet_metrics(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async fan-out"""
+    base = f"{mock_client_url}/v2/monitoring/metrics/droplet"
+
+    def metrics(url, **_kwargs):
+        host = url.query["host_id"]
+        return CallbackResult(status=200, payload=_series(host, "0.25"))
+
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            re.compile(rf"^{base}/memory_free\?"), callback=metrics, repeat=True
+        )
+        result = await async_fetch_droplet_metrics(
+            mock_aio_client, ["1", "2"], ["memory_free"], start=0, end=60
+        )
+
+    assert result.get("2", "memory_free")[0]["metric"]["host_id"] == "2"
+    assert not result.failed
+
+
+def test_decode_series_and_resample():
+    """Tests series decode into float columns and resample into buckets"""
+    series = decode_series(
+        [
+            {
+                "metric": {"host_id": "1"},
+                "values": [[0, "1"], [30, "3"], [60, "NaN"], [120, "8"], [90, "4"]],
+            }
+        ]
+    )[0]
+
+    assert series.labels == {"host_id": "1"}
+    assert series.values.dtype == numpy.float64
+    assert numpy.isnan(series.values[2])
+    resampled = series.resample(60, how="max")
+    assert resampled.timestamps.tolist() == [0, 60, 120]
+    assert resampled.values[0] == 3 and resampled.values[2] == 8
+    assert series.resample(60, how="count").values.tolist() == [2, 1, 1]
+    assert series.resample(60, how="last").values.tolist() == [3, 4, 8]
+    assert series.aggregate("sum") == 16
+    assert series.aggregate("max") == 8
+    assert numpy.isnan(decode_series([{"metric": {}, "values": []}])[0].aggregate())
+    with pytest.raises(ValueError):
+        series.resample(60, how="median")
+
+
+def test_combine_series_across_hosts():
+    """Tests decoded fleet series combine per timestamp bucket"""
+    result = MetricsResult("0", "120")
+    result.series = {
+        host: {"cpu": _series(str(host), str(host))["data"]["result"]}
+        for host in (1, 2, 3)
+    }
+
+    decoded = decode_metrics(result)
+    fleet = combine_series([decoded[h]["cpu"][0] for h in decoded], how="mean")
+
+    assert fleet.timestamps.tolist() == [1700000000, 1700000060]
+    assert fleet.values.tolist() == [2.0, 2.0]
+    total = combine_series(
+        [decoded[h]["cpu"][0] for h in decoded], how="sum", step=3600
+    )
+    assert total.values.tolist() == [12.0]
+
+
+def test_metric_chunks_are_aligned():
+    """Tests windows align to the chunk size so backfills share chunks"""
+    assert metric_chunks(5400, 9000, 3600) == [(3600, 7200), (7200, 10800)]
+    assert metric_chunks(7200, 7200, 3600) == [(7200, 10800)]
+    with pytest.raises(ValueError):
+        metric_chunks(10, 5, 3600)
+
+
+def test_stitch_series_deduplicates_and_trims():
+    """Tests chunk boundaries are de-duplicated and the range trimmed"""
+    first = [{"metric": {"host_id": "1"}, "values": [[0, "1"], [60, "2"]]}]
+    second = [
+        {"metric": {"host_id": "1"}, "values": [[60, "2"], [120, "3"]]},
+        {"metric": {"host_id": "2"}, "values": [[120, "9"]]},
+    ]
+
+    assert stitch_series([first, second], start=60) == [
+        {"metric": {"host_id": "1"}, "values": [[60, "2"], [120, "3"]]},
+        {"metric": {"host_id": "2"}, "values": [[120, "9"]]},
+    ]
+
+
+@responses.activate
+def test_backfill_metrics_reuses_stored_chunks(
+    mock_client: Client, mock_client_url, tmp_path
+):
+    """Tests chunks are fetched, stitched and reused from the store"""
+
+    def cpu(request):
+        start, end = int(request.params["start"]), int(request.params["end"])
+        body = {
+            "status": "success",
+            "data": {
+                "resultType": "matrix",
+                "result": [
+                    {
+                        "metric": {"host_id": request.params["host_id"]},
+                        "values": [[t, str(t)] for t in range(start, end + 1, 1800)],
+                    }
+                ],
+            },
+        }
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(
+        responses.GET, f"{mock_client_url}/v2/monitoring/metrics/droplet/cpu", cpu
+    )
+    store = SqliteMetricStore(str(tmp_path / "metrics.sqlite3"))
+
+    result = backfill_metrics(
+        mock_client,
+        [1, 2],
+        ["cpu"],
+        start=1800,
+        end=9000,
+        chunk_seconds=3600,
+        store=store,
+    )
+
+    assert result.requests == 6 and result.reused == 0
+    assert len(store) == 6
+    values = result.get(1, "cpu")[0]["values"]
+    assert [t for t, _ in values] == [1800, 3600, 5400, 7200, 9000]
+
+    again = backfill_metrics(
+        mock_client,
+        [1],
+        ["cpu"],
+        start=0,
+        end=10799,
+        chunk_seconds=3600,
+        store=store,
+    )
+
+    assert again.requests == 0 and again.reused == 3
+    assert len(again.get(1, "cpu")[0]["values"]) == 6
+    store.close()
+
+
+@responses.activate
+def test_backfill_metrics_reports_every_failed_chunk(mock_client_url):
+    """Tests each failed chunk is listed, transport errors included"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+
+    def cpu(request):
+        start = request.params["start"]
+        if start == "0":
+            return (403, {}, json.dumps({"id": "forbidden"}))
+        if start == "3600":
+            raise requests.exceptions.ConnectionError("connection reset")
+        return (200, {}, json.dumps(_series(request.params["host_id"], start)))
+
+    responses.add_callback(
+        responses.GET, f"{mock_client_url}/v2/monitoring/metrics/droplet/cpu", cpu
+    )
+
+    result = backfill_metrics(
+        client, [1], ["cpu"], start=0, end=10799, chunk_seconds=3600
+    )
+
+    assert sorted(result.failed) == [(1, "cpu", (0, 3600)), (1, "cpu", (3600, 7200))]
+    assert isinstance(result.failed[(1, "cpu", (3600, 7200))], ServiceRequestError)
+    assert result.get(1, "cpu")
+
+
+@pytest.mark.asyncio
+async def test_async_backfill_app_metrics(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async backfill of App metrics and its failure reporting"""
+    calls = []
+
+    def app_cpu(url, **_kwargs):
+        calls.append(dict(url.query))
+        if url.query["start"] == "3600":
+            return CallbackResult(status=403, payload={"id": "forbidden"})
+        return CallbackResult(
+            status=200,
+            payload={
+                "status": "success",
+                "data": {
+                    "resultType": "matrix",
+                    "result": [
+                        {"metric": {"app_component": "web"}, "values": [[60, "5"]]}
+                    ],
+                },
+            },
+        )
+
+    store = MemoryMetricStore()
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            re.compile(
+                rf"^{mock_client_url}/v2/monitoring/metrics/apps/cpu_percentage\?"
+            ),
+            callback=app_cpu,
+            repeat=True,
+        )
+        result = await async_backfill_metrics(
+            mock_aio_client,
+            ["app-1"],
+            ["app_cpu_percentage"],
+            start=0,
+            end=7199,
+            chunk_seconds=3600,
+            app_component="web",
+            store=store,
+        )
+
+    assert {c["app_component"] for c in calls} == {"web"}
+    assert list(result.failed) == [("app-1", "app_cpu_percentage", (3600, 7200))]
+    assert result.get("app-1", "app_cpu_percentage")[0]["values"] == [[60, "5"]]
+    assert len(store) == 1
@@ -0,0 +1,219 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the lazy pagination helpers"""
+
+import asyncio
+import re
+
+import pytest
+import responses
+from aioresponses import aioresponses
+from responses import matchers
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_pagination import async_paginate, paginate
+
+
+def _page_url(key, page, per_page):
+    return f"https://api.digitalocean.com/v2/{key}?page={page}&per_page={per_page}"
+
+
+def _page(key, items, total=None, **links):
+    """List response; *links* takes ``next_page``, ``last_page`` and
+    ``per_page`` (default 2)."""
+    per_page = links.get("per_page", 2)
+    pages = {}
+    for rel in ("next", "last"):
+        if links.get(f"{rel}_page"):
+            pages[rel] = _page_url(key, links[f"{rel}_page"], per_page)
+    return {
+        key: items,
+        "links": {"pages": pages},
+        "meta": {"total": total if total is not None else len(items)},
+    }
+
+
+@responses.activate
+def test_iter_list_follows_next_links(mock_client: Client, mock_client_url):
+    """Tests that iter_list yields items from every page in order"""
+    for page, items, next_page in [
+        (1, [{"id": 1}, {"id": 2}], 2),
+        (2, [{"id": 3}, {"id": 4}], 3),
+        (3, [{"id": 5}], None),
+    ]:
+        responses.add(
+            responses.GET,
+            f"{mock_client_url}/v2/droplets",
+            json=_page("droplets", items, next_page=next_page, total=5),
+            match=[matchers.query_param_matcher({"per_page": 2, "page": page})],
+        )
+
+    ids = [d["id"] for d in mock_client.droplets.iter_list(per_page=2)]
+
+    assert ids == [1, 2, 3, 4, 5]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_iter_list_is_lazy(mock_client: Client, mock_client_url):
+    """Tests that pages are only requested as items are consumed"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/domains/example.com/records",
+        json=_page("domain_records", [{"id": 1}, {"id": 2}], next_page=2),
+        match=[matchers.query_param_matcher({"per_page": 2, "page": 1})],
+    )
+
+    records = mock_client.domains.iter_list_records("example.com", per_page=2)
+    assert next(records) == {"id": 1}
+    assert next(records) == {"id": 2}
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_paginate_passes_filters(mock_client: Client, mock_client_url):
+    """Tests that filter arguments are sent with every page request"""
+    for page, next_page in [(1, 2), (2, None)]:
+        responses.add(
+            responses.GET,
+            f"{mock_client_url}/v2/droplets",
+            json=_page("droplets", [{"id": page}], next_page=next_page, per_page=200),
+            match=[
+                matchers.query_param_matcher(
+                    {"per_page": 200, "page": page, "tag_name": "web"}
+                )
+            ],
+        )
+
+    items = list(paginate(mock_client.droplets.list, per_page=500, tag_name="web"))
+
+    assert items == [{"id": 1}, {"id": 2}]
+
+
+def test_paginate_requires_item_key_when_ambiguous():
+    """Tests that ambiguous responses ask for an explicit item_key"""
+
+    def fake_list(**_):
+        return {"a": [1], "b": [2], "links": {}}
+
+    with pytest.raises(ValueError):
+        list(paginate(fake_list))
+
+    assert list(paginate(fake_list, item_key="b")) == [2]
+
+
+def test_companions_only_for_paginated_methods(mock_client: Client):
+    """Tests that iter_* companions are installed only where page is accepted"""
+    assert callable(mock_client.droplets.iter_list)
+    assert callable(mock_client.monitoring.iter_list_alert_policy)
+    assert not hasattr(mock_client.droplets, "iter_get")
+
+
+@responses.activate
+def test_concurrent_fan_out_keeps_page_order(mock_client: Client, mock_client_url):
+    """Tests that pages 2..N are fetched concurrently but yielded in order"""
+    for page in range(1, 6):
+        responses.add(
+            responses.GET,
+            f"{mock_client_url}/v2/volumes",
+            json=_page(
+                "volumes",
+                [{"id": page * 10}, {"id": page * 10 + 1}],
+                next_page=page + 1 if page < 5 else None,
+                last_page=5,
+                total=10,
+            ),
+            match=[matchers.query_param_matcher({"per_page": 2, "page": page})],
+        )
+
+    ids = [
+        v["id"] for v in mock_client.volumes.iter_list(per_page=2, max_concurrency=3)
+    ]
+
+    assert ids == [10, 11, 20, 21, 30, 31, 40, 41, 50, 51]
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_concurrent_fan_out_from_meta_total(mock_client: Client, mock_client_url):
+    """Tests that meta.total is used when links.pages.last is missing"""
+    for page in range(1, 4):
+        responses.add(
+            responses.GET,
+            f"{mock_client_url}/v2/droplets",
+            json=_page(
+                "droplets",
+                [{"id": page}],
+                next_page=page + 1 if page < 3 else None,
+                per_page=1,
+                total=3,
+            ),
+            match=[matchers.query_param_matcher({"per_page": 1, "page": page})],
+        )
+
+    items = list(paginate(mock_client.droplets.list, per_page=1, max_concurrency=4))
+
+    assert items == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_fan_out(mock_aio_client: aioClient, mock_client_url):
+    """Tests the asyncio fan-out yields every item in page order"""
+    with aioresponses() as mock_resp:
+        for page in range(1, 5):
+            mock_resp.get(
+                re.compile(rf"{mock_client_url}/v2/account/keys\?.*page={page}(&|$).*"),
+                status=200,
+                payload=_page(
+                    "ssh_keys",
+                    [{"id": page}],
+                    next_page=page + 1 if page < 4 else None,
+                    last_page=4,
+                    per_page=1,
+                ),
+            )
+
+        ids = [
+            k["id"]
+            async for k in async_paginate(
+                mock_aio_client.ssh_keys.list, per_page=1, max_concurrency=2
+            )
+        ]
+
+    assert ids == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_async_iter_list_companion(mock_aio_client: aioClient, mock_client_url):
+    """Tests the aio client exposes iter_* companions as async generators"""
+    with aioresponses() as mock_resp:
+        for page, next_page in [(1, 2), (2, 3), (3, None)]:
+            mock_resp.get(
+                re.compile(rf"{mock_client_url}/v2/droplets\?.*page={page}(&|$).*"),
+                status=200,
+                payload=_page(
+                    "droplets", [{"id": page}], next_page=next_page, per_page=1
+                ),
+            )
+
+        ids = [d["id"] async for d in mock_aio_client.droplets.iter_list(per_page=1)]
+
+    assert ids == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_async_prefetches_next_page():
+    """Tests the next page is requested before the current one is consumed"""
+    requested = []
+
+    async def fake_list(page=1):
+        requested.append(page)
+        return _page("things", [page], next_page=page + 1 if page < 3 else None)
+
+    items = async_paginate(fake_list)
+    assert await items.__anext__() == 1
+    await asyncio.sleep(0)
+    assert requested == [1, 2]
+    assert [item async for item in items] == [2, 3]
+    assert requested == [1, 2, 3]
@@ -0,0 +1,463 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the desired-state reconcilers"""
+
+import json
+
+import pytest
+import requests
+import responses
+from aioresponses import aioresponses
+from azure.core.exceptions import ServiceRequestError
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_reconcilers import (
+    async_reconcile_dns_records,
+    async_reconcile_firewalls,
+    async_reconcile_load_balancers,
+    plan_dns_records,
+    plan_firewalls,
+    plan_load_balancer,
+    reconcile_dns_records,
+    reconcile_firewalls,
+    reconcile_load_balancers,
+)
+
+RECORDS = [
+    {"id": 1, "type": "SOA", "name": "@", "data": "1800", "ttl": 1800},
+    {"id": 2, "type": "NS", "name": "@", "data": "ns1.digitalocean.com", "ttl": 1800},
+    {"id": 3, "type": "A", "name": "@", "data": "203.0.113.10", "ttl": 1800},
+    {"id": 4, "type": "A", "name": "www", "data": "203.0.113.10", "ttl": 1800},
+    {"id": 5, "type": "MX", "name": "@", "data": "mx1.example.com", "priority": 10},
+    {"id": 6, "type": "TXT", "name": "old", "data": "stale", "ttl": 1800},
+]
+
+
+def _summary(changes):
+    return sorted((c.action, c.target, c.args[1:]) for c in changes)
+
+
+def test_plan_dns_records_is_minimal():
+    """Tests unchanged records are skipped and changes become patches"""
+    desired = [
+        {"type": "A", "name": "example.com.", "data": "203.0.113.10"},
+        {"type": "A", "name": "www", "data": "203.0.113.20", "ttl": 300},
+        {"type": "MX", "name": "@", "data": "MX1.example.com.", "priority": 20},
+        {"type": "TXT", "name": "new", "data": "hello"},
+    ]
+
+    changes = plan_dns_records("example.com", RECORDS, desired)
+
+    assert _summary(changes) == [
+        (
+            "create",
+            ("TXT", "new", "hello"),
+            ({"type": "TXT", "name": "new", "data": "hello"},),
+        ),
+        ("delete", ("TXT", "old", "stale"), (6,)),
+        (
+            "update",
+            ("A", "www", "203.0.113.20"),
+            (4, {"ttl": 300, "data": "203.0.113.20", "type": "A"}),
+        ),
+        ("update", ("MX", "@", "mx1.example.com"), (5, {"priority": 20, "type": "MX"})),
+    ]
+
+
+def test_plan_dns_records_without_prune_keeps_extra_records():
+    """Tests prune=False never deletes and managed records are left alone"""
+    assert not plan_dns_records("example.com", RECORDS, [], prune=False)
+    deleted = {c.args[1] for c in plan_dns_records("example.com", RECORDS, [])}
+    assert deleted == {3, 4, 5, 6}
+
+
+@responses.activate
+def test_reconcile_dns_records_applies_changes(mock_client: Client, mock_client_url):
+    """Tests the reconciler pages records and applies the planned calls"""
+    base = f"{mock_client_url}/v2/domains/example.com/records"
+    responses.add(
+        responses.GET,
+        base,
+        json={"domain_records": RECORDS, "links": {"pages": {}}, "meta": {"total": 6}},
+    )
+    responses.add(responses.DELETE, f"{base}/6", status=204)
+    responses.add(
+        responses.POST,
+        base,
+        json={"domain_record": {"id": 7}},
+        status=201,
+    )
+
+    result = reconcile_dns_records(
+        mock_client,
+        "example.com",
+        RECORDS[2:5] + [{"type": "TXT", "name": "new", "data": "hello"}],
+    )
+
+    assert result.converged
+    assert [c.action for c in result.applied] == ["delete", "create"]
+    methods = [c.request.method for c in responses.calls]
+    assert methods == ["GET", "DELETE", "POST"]
+    assert json.loads(responses.calls[2].request.body)["name"] == "new"
+
+
+@responses.activate
+def test_reconcile_dns_records_reports_connection_errors(mock_client_url):
+    """Tests a dropped connection fails one change and the rest are applied"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+    base = f"{mock_client_url}/v2/domains/example.com/records"
+    responses.add(
+        responses.GET,
+        base,
+        json={"domain_records": RECORDS, "links": {"pages": {}}, "meta": {"total": 6}},
+    )
+    responses.add(
+        responses.DELETE,
+        f"{base}/6",
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+    responses.add(responses.POST, base, json={"domain_record": {"id": 7}}, status=201)
+
+    result = reconcile_dns_records(
+        client,
+        "example.com",
+        RECORDS[2:5] + [{"type": "TXT", "name": "new", "data": "hello"}],
+    )
+
+    assert [c.action for c in result.applied] == ["create"]
+    assert [c.action for c, _ in result.failed] == ["delete"]
+    assert isinstance(result.failed[0][1], ServiceRequestError)
+
+
+@responses.activate
+def test_reconcile_dns_records_dry_run(mock_client: Client, mock_client_url):
+    """Tests a dry run only plans"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/domains/example.com/records",
+        json={"domain_records": RECORDS, "links": {"pages": {}}, "meta": {"total": 6}},
+    )
+
+    result = reconcile_dns_records(mock_client, "example.com", [], dry_run=True)
+
+    assert len(result.changes) == 4
+    assert not result.applied
+    assert not result.converged
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_reconcile_dns_records(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async reconciler reports failed changes"""
+    base = f"{mock_client_url}/v2/domains/example.com/records"
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            f"{base}?per_page=200&page=1",
+            status=200,
+            payload={
+                "domain_records": RECORDS,
+                "links": {"pages": {}},
+                "meta": {"total": 6},
+            },
+        )
+        mock_resp.patch(f"{base}/4", status=200, payload={"domain_record": {"id": 4}})
+        mock_resp.delete(
+            f"{base}/6",
+            status=403,
+            payload={"id": "forbidden", "message": "read-only token"},
+        )
+
+        result = await async_reconcile_dns_records(
+            mock_aio_client,
+            "example.com",
+            [RECORDS[2], dict(RECORDS[3], ttl=60), RECORDS[4]],
+        )
+
+    assert [c.action for c in result.applied] == ["update"]
+    assert [(c.action, err.status_code) for c, err in result.failed] == [
+        ("delete", 403)
+    ]
+
+
+FIREWALL = {
+    "id": "fw-1",
+    "name": "web",
+    "inbound_rules": [
+        {
+            "protocol": "tcp",
+            "ports": "22",
+            "sources": {"addresses": ["10.0.0.1/32", "10.0.0.2"]},
+        },
+        {"protocol": "tcp", "ports": "80-80", "sources": {"tags": ["lb"]}},
+    ],
+    "outbound_rules": [
+        {
+            "protocol": "icmp",
+            "ports": "0",
+            "destinations": {"addresses": ["0.0.0.0/0"]},
+        }
+    ],
+    "tags": ["web"],
+    "droplet_ids": [1, 2],
+}
+
+
+def test_plan_firewalls_sends_only_differing_entries():
+    """Tests rules are diffed per peer and batched per firewall"""
+    desired = {
+        "web": {
+            "inbound_rules": [
+                {
+                    "protocol": "TCP",
+                    "ports": "22",
+                    "sources": {"addresses": ["10.0.0.1", "10.0.0.3"]},
+                },
+                {"protocol": "tcp", "ports": "80", "sources": {"tags": ["lb"]}},
+            ],
+            "droplet_ids": [2, 3],
+        }
+    }
+
+    changes = plan_firewalls([FIREWALL], desired)
+
+    assert sorted((c.phase, c.operation, c.args) for c in changes) == [
+        (
+            0,
+            "firewalls.add_rules",
+            (
+                "fw-1",
+                {
+                    "inbound_rules": [
+                        {
+                            "protocol": "tcp",
+                            "ports": "22",
+                            "sources": {"addresses": ["10.0.0.3"]},
+                        }
+                    ]
+                },
+            ),
+        ),
+        (0, "firewalls.assign_droplets", ("fw-1", {"droplet_ids": [3]})),
+        (
+            1,
+            "firewalls.delete_droplets",
+            ("fw-1", {"droplet_ids": [1]}),
+        ),
+        (
+            1,
+            "firewalls.delete_rules",
+            (
+                "fw-1",
+                {
+                    "inbound_rules": [
+                        {
+                            "protocol": "tcp",
+                            "ports": "22",
+                            "sources": {"addresses": ["10.0.0.2"]},
+                        }
+                    ]
+                },
+            ),
+        ),
+    ]
+
+
+def test_plan_firewalls_converged_and_unknown():
+    """Tests a matching firewall plans nothing and unknown ones raise"""
+    assert not plan_firewalls([FIREWALL], {"fw-1": FIREWALL})
+    with pytest.raises(ValueError, match="missing"):
+        plan_firewalls([FIREWALL], {"missing": {"tags": []}})
+
+
+def test_plan_firewalls_rejects_ambiguous_names():
+    """Tests a name shared by several firewalls must be replaced by an ID"""
+    twin = dict(FIREWALL, id="fw-2")
+    with pytest.raises(ValueError, match="fw-1, fw-2"):
+        plan_firewalls([FIREWALL, twin], {FIREWALL["name"]: {"tags": []}})
+    assert len(plan_firewalls([FIREWALL, twin], {"fw-2": {"tags": []}})) == 1
+
+
+@responses.activate
+def test_reconcile_firewalls_applies_changes(mock_client: Client, mock_client_url):
+    """Tests the reconciler lists firewalls once and posts the diff"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/firewalls",
+        json={"firewalls": [FIREWALL], "links": {"pages": {}}, "meta": {"total": 1}},
+    )
+    responses.add(
+        responses.POST, f"{mock_client_url}/v2/firewalls/fw-1/tags", status=204
+    )
+    responses.add(
+        responses.DELETE, f"{mock_client_url}/v2/firewalls/fw-1/tags", status=204
+    )
+
+    result = reconcile_firewalls(mock_client, {"web": {"tags": ["api"]}})
+
+    assert result.converged
+    assert [
+        (c.request.method, json.loads(c.request.body)) for c in responses.calls[1:]
+    ] == [("POST", {"tags": ["api"]}), ("DELETE", {"tags": ["web"]})]
+
+
+@pytest.mark.asyncio
+async def test_async_reconcile_firewalls(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async firewall reconciler"""
+    desired = {
+        "fw-1": {
+            "outbound_rules": [
+                {
+                    "protocol": "icmp",
+                    "destinations": {"addresses": ["0.0.0.0/0", "::/0"]},
+                }
+            ]
+        }
+    }
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            f"{mock_client_url}/v2/firewalls?per_page=200&page=1",
+            status=200,
+            payload={
+                "firewalls": [FIREWALL],
+                "links": {"pages": {}},
+                "meta": {"total": 1},
+            },
+        )
+        mock_resp.post(f"{mock_client_url}/v2/firewalls/fw-1/rules", status=204)
+
+        result = await async_reconcile_firewalls(mock_aio_client, desired)
+
+    assert result.converged
+    assert result.applied[0].args[1] == {
+        "outbound_rules": [
+            {"protocol": "icmp", "destinations": {"addresses": ["::/0"]}}
+        ]
+    }
+
+
+HTTP = {
+    "entry_protocol": "http",
+    "entry_port": 80,
+    "target_protocol": "http",
+    "target_port": 80,
+}
+HTTPS = {
+    "entry_protocol": "https",
+    "entry_port": 443,
+    "target_protocol": "http",
+    "target_port": 80,
+    "certificate_id": "cert-1",
+}
+LOAD_BALANCER = {
+    "id": "lb-1",
+    "droplet_ids": [1, 2],
+    "forwarding_rules": [HTTP],
+}
+
+
+def test_plan_load_balancer_orders_cutover():
+    """Tests additions precede removals and conflicting rules wait for them"""
+    moved = dict(HTTP, target_port=8080, entry_protocol="HTTP")
+    changes = plan_load_balancer(
+        LOAD_BALANCER, {"droplet_ids": [2, 3], "forwarding_rules": [moved, HTTPS]}
+    )
+
+    assert [(c.phase, c.operation, c.args[1]) for c in changes] == [
+        (0, "load_balancers.add_forwarding_rules", {"forwarding_rules": [HTTPS]}),
+        (1, "load_balancers.remove_forwarding_rules", {"forwarding_rules": [HTTP]}),
+        (2, "load_balancers.add_forwarding_rules", {"forwarding_rules": [moved]}),
+        (0, "load_balancers.add_droplets", {"droplet_ids": [3]}),
+        (3, "load_balancers.remove_droplets", {"droplet_ids": [1]}),
+    ]
+    assert not plan_load_balancer(LOAD_BALANCER, LOAD_BALANCER)
+
+
+def test_plan_load_balancer_rejects_tag_selected():
+    """Tests Droplets cannot be managed on a tag-selected load balancer"""
+    with pytest.raises(ValueError, match="tag"):
+        plan_load_balancer(dict(LOAD_BALANCER, tag="web"), {"droplet_ids": [1]})
+
+
+@responses.activate
+def test_reconcile_load_balancers(mock_client: Client, mock_client_url):
+    """Tests load balancers are read, diffed and unusable ones reported"""
+    base = f"{mock_client_url}/v2/load_balancers"
+    responses.add(responses.GET, f"{base}/lb-1", json={"load_balancer": LOAD_BALANCER})
+    responses.add(
+        responses.GET,
+        f"{base}/lb-2",
+        json={"id": "forbidden", "message": "no"},
+        status=403,
+    )
+    responses.add(
+        responses.GET,
+        f"{base}/lb-3",
+        json={"load_balancer": dict(LOAD_BALANCER, id="lb-3", tag="web")},
+    )
+    responses.add(responses.POST, f"{base}/lb-1/droplets", status=204)
+    responses.add(responses.DELETE, f"{base}/lb-1/droplets", status=204)
+
+    result = reconcile_load_balancers(
+        mock_client,
+        {lb_id: {"droplet_ids": [3, 4]} for lb_id in ("lb-1", "lb-2", "lb-3")},
+    )
+
+    assert [(c.action, c.target) for c in result.applied] == [
+        ("add", "lb-1"),
+        ("remove", "lb-1"),
+    ]
+    assert [(c.action, c.target) for c, _ in result.failed] == [
+        ("read", "lb-2"),
+        ("read", "lb-3"),
+    ]
+    assert isinstance(result.failed[1][1], ValueError)
+    assert not result.converged
+    writes = [c.request for c in responses.calls if c.request.method != "GET"]
+    assert [(r.method, json.loads(r.body)) for r in writes] == [
+        ("POST", {"droplet_ids": [3, 4]}),
+        ("DELETE", {"droplet_ids": [1, 2]}),
+    ]
+
+
+@responses.activate
+def test_reconcile_load_balancers_reports_connection_errors(mock_client_url):
+    """Tests a dropped connection on one read leaves the batch going"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+    base = f"{mock_client_url}/v2/load_balancers"
+    responses.add(responses.GET, f"{base}/lb-1", json={"load_balancer": LOAD_BALANCER})
+    responses.add(
+        responses.GET,
+        f"{base}/lb-2",
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+    responses.add(responses.POST, f"{base}/lb-1/droplets", status=204)
+    responses.add(responses.DELETE, f"{base}/lb-1/droplets", status=204)
+
+    result = reconcile_load_balancers(
+        client, {lb_id: {"droplet_ids": [3, 4]} for lb_id in ("lb-1", "lb-2")}
+    )
+
+    assert [c.target for c in result.applied] == ["lb-1", "lb-1"]
+    assert [(c.action, c.target) for c, _ in result.failed] == [("read", "lb-2")]
+    assert isinstance(result.failed[0][1], ServiceRequestError)
+
+
+@pytest.mark.asyncio
+async def test_async_reconcile_load_balancers(
+    mock_aio_client: aioClient, mock_client_url
+):
+    """Tests the async load balancer reconciler"""
+    base = f"{mock_client_url}/v2/load_balancers"
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            f"{base}/lb-1", status=200, payload={"load_balancer": LOAD_BALANCER}
+        )
+        mock_resp.post(f"{base}/lb-1/forwarding_rules", status=204)
+
+        result = await async_reconcile_load_balancers(
+            mock_aio_client, {"lb-1": {"forwarding_rules": [HTTP, HTTPS]}}
+        )
+
+    assert result.converged
+    assert result.applied[0].args == ("lb-1", {"forwarding_rules": [HTTPS]})
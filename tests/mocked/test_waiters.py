@@ -0,0 +1,506 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the action waiters"""
+
+import asyncio
+import re
+import time
+
+import aiohttp
+import pytest
+import requests
+import responses
+from aioresponses import CallbackResult, aioresponses
+from azure.core.exceptions import HttpResponseError, ServiceRequestError
+from responses import matchers
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_waiters import (
+    ActionWaiter,
+    ActionWatcher,
+    AsyncResourceWaiter,
+    ResourceWaiter,
+)
+from pydo.exceptions import ActionError, ResourceStateError
+
+FAST = {"intervals": {"reboot": 0.01, "snapshot": 0.01}, "max_interval": 0.05}
+FAST_RESOURCES = {"min_interval": 0.01, "max_interval": 0.05}
+
+
+def _action(action_id, status="in-progress", action_type="reboot"):
+    return {
+        "id": action_id,
+        "status": status,
+        "type": action_type,
+        "resource_id": action_id * 10,
+        "resource_type": "droplet",
+    }
+
+
+def _actions_page(actions, next_page=None):
+    pages = {}
+    if next_page:
+        pages["next"] = f"https://api.digitalocean.com/v2/actions?page={next_page}"
+    return {"actions": actions, "links": {"pages": pages}, "meta": {"total": 0}}
+
+
+@responses.activate
+def test_waiter_resolves_many_actions_per_request(mock_client: Client, mock_client_url):
+    """Tests one actions.list page resolves every tracked action"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json=_actions_page([_action(i) for i in range(105, 99, -1)]),
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json=_actions_page([_action(i, "completed") for i in range(105, 99, -1)]),
+    )
+
+    with ActionWaiter(mock_client, **FAST) as waiter:
+        results = waiter.wait_all(range(100, 106), timeout=5)
+
+    assert [a["id"] for a in results] == list(range(100, 106))
+    assert all(a["status"] == "completed" for a in results)
+    assert waiter.requests == 2
+    assert not any("/v2/actions/" in c.request.url for c in responses.calls)
+
+
+@responses.activate
+def test_waiter_reads_more_pages_until_oldest_action(
+    mock_client: Client, mock_client_url
+):
+    """Tests later pages are read only while tracked actions may be on them"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json=_actions_page([_action(300, "completed"), _action(299)], next_page=2),
+        match=[matchers.query_param_matcher({"per_page": 200, "page": 1})],
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json=_actions_page([_action(200, "completed"), _action(199)], next_page=3),
+        match=[matchers.query_param_matcher({"per_page": 200, "page": 2})],
+    )
+
+    with ActionWaiter(mock_client, **FAST) as waiter:
+        first, second = waiter.wait(300), waiter.wait(200)
+        assert first.result(5)["id"] == 300
+        assert second.result(5)["id"] == 200
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_waiter_pages_past_three_for_many_actions(mock_client: Client, mock_client_url):
+    """Tests the page budget follows the pending actions, not a fixed cap"""
+    for page in range(1, 6):
+        action_id = 600 - page * 100
+        responses.add(
+            responses.GET,
+            f"{mock_client_url}/v2/actions",
+            json=_actions_page(
+                [_action(action_id + 1, "completed"), _action(action_id, "completed")],
+                next_page=page + 1,
+            ),
+            match=[matchers.query_param_matcher({"per_page": 200, "page": page})],
+        )
+
+    with ActionWaiter(mock_client, **FAST) as waiter:
+        results = waiter.wait_all([500, 400, 300, 200, 100], timeout=5)
+
+    assert [a["id"] for a in results] == [500, 400, 300, 200, 100]
+    assert waiter.requests == 5
+    assert not any("/v2/actions/" in c.request.url for c in responses.calls)
+
+
+@responses.activate
+def test_waiter_falls_back_to_get_for_old_actions(mock_client: Client, mock_client_url):
+    """Tests actions missing from the newest pages are fetched individually"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json=_actions_page([_action(900, "completed")], next_page=2),
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions/5",
+        json={"action": _action(5, "completed", "snapshot")},
+    )
+
+    with ActionWaiter(mock_client, max_pages=1, **FAST) as waiter:
+        action = waiter.wait({"action": _action(5, action_type="snapshot")}).result(5)
+
+    assert action["type"] == "snapshot"
+
+
+@responses.activate
+def test_waiter_raises_for_errored_actions(mock_client: Client, mock_client_url):
+    """Tests an errored action fails its future with ActionError"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json=_actions_page([_action(7, "errored")]),
+    )
+
+    with ActionWaiter(mock_client, **FAST) as waiter:
+        future = waiter.wait(7)
+        with pytest.raises(ActionError) as err:
+            future.result(5)
+
+    assert err.value.action["id"] == 7
+
+
+def test_waiter_resolves_finished_actions_without_polling(mock_client: Client):
+    """Tests an already finished action needs no request"""
+    with ActionWaiter(mock_client) as waiter:
+        future = waiter.wait({"action": _action(1, "completed")})
+
+    assert future.result(0)["id"] == 1
+    assert waiter.requests == 0
+
+
+@responses.activate
+def test_waiter_gives_up_after_repeated_errors(mock_client: Client, mock_client_url):
+    """Tests failed poll rounds are retried, then surfaced on the futures"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        status=401,
+        json={"id": "unauthorized", "message": "Unable to authenticate you."},
+    )
+
+    with ActionWaiter(mock_client, max_errors=2, **FAST) as waiter:
+        future = waiter.wait(1)
+        with pytest.raises(Exception) as err:
+            future.result(5)
+
+    assert getattr(err.value, "status_code", None) == 401
+    assert waiter.requests == 2
+
+
+@responses.activate
+def test_waiter_survives_connection_errors(mock_client_url):
+    """Tests a dropped connection counts as a failed round, not a dead thread"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        json=_actions_page([_action(1, "completed")]),
+    )
+
+    with ActionWaiter(client, **FAST) as waiter:
+        assert waiter.wait(1).result(5)["status"] == "completed"
+
+    assert waiter.requests == 2
+
+
+@responses.activate
+def test_waiter_gives_up_after_repeated_connection_errors(mock_client_url):
+    """Tests connection errors reach the futures once max_errors is hit"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/actions",
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+
+    with ActionWaiter(client, max_errors=2, **FAST) as waiter:
+        with pytest.raises(ServiceRequestError):
+            waiter.wait(1).result(5)
+
+    assert waiter.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_multiplexes_waits(mock_aio_client: aioClient, mock_client_url):
+    """Tests many async waits are served by shared actions.list requests"""
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            re.compile(rf"{mock_client_url}/v2/actions\?.*"),
+            status=200,
+            payload=_actions_page([_action(i) for i in range(20, 0, -1)]),
+        )
+        mock_resp.get(
+            re.compile(rf"{mock_client_url}/v2/actions\?.*"),
+            status=200,
+            payload=_actions_page([_action(i, "completed") for i in range(20, 0, -1)]),
+        )
+
+        async with ActionWatcher(mock_aio_client, **FAST) as watcher:
+            results = await watcher.wait_all(range(1, 21), timeout=5)
+
+    assert [a["id"] for a in results] == list(range(1, 21))
+    assert watcher.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_errored_action(mock_aio_client: aioClient, mock_client_url):
+    """Tests an errored action fails its asyncio future"""
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            re.compile(rf"{mock_client_url}/v2/actions\?.*"),
+            status=200,
+            payload=_actions_page([_action(3, "errored"), _action(2, "completed")]),
+        )
+
+        async with ActionWatcher(mock_aio_client, **FAST) as watcher:
+            failed, done = watcher.watch(3), watcher.watch(2)
+            with pytest.raises(ActionError):
+                await failed
+            assert (await done)["id"] == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_deadline_and_cancel(mock_aio_client: aioClient, mock_client_url):
+    """Tests deadlines fail waits and cancelled waits stop being tracked"""
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            re.compile(rf"{mock_client_url}/v2/actions\?.*"),
+            status=200,
+            payload=_actions_page([_action(2), _action(1)]),
+            repeat=True,
+        )
+
+        async with ActionWatcher(mock_aio_client, **FAST) as watcher:
+            expiring = watcher.watch(1, timeout=0.05)
+            cancelled = watcher.watch(2)
+            cancelled.cancel()
+            with pytest.raises(asyncio.TimeoutError):
+                await expiring
+            assert watcher.pending == 0
+
+    assert cancelled.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_watcher_timeouts_are_per_caller(
+    mock_aio_client: aioClient, mock_client_url
+):
+    """Tests one caller's timeout does not fail another wait on the action"""
+    started = time.monotonic()
+
+    def actions(_url, **_kwargs):
+        status = "completed" if time.monotonic() - started > 0.2 else "in-progress"
+        return CallbackResult(status=200, payload=_actions_page([_action(1, status)]))
+
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            re.compile(rf"{mock_client_url}/v2/actions\?.*"),
+            callback=actions,
+            repeat=True,
+        )
+
+        async with ActionWatcher(mock_aio_client, **FAST) as watcher:
+            short = watcher.watch(1, timeout=0.05)
+            long = watcher.watch(1, timeout=5)
+            with pytest.raises(asyncio.TimeoutError):
+                await short
+            assert (await long)["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_watcher_bounds_action_gets(mock_aio_client: aioClient, mock_client_url):
+    """Tests actions missing from the list are fetched a few at a time"""
+    in_flight = []
+    peak = []
+
+    async def get(url, **_kwargs):
+        in_flight.append(url)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(url)
+        action_id = int(str(url).rsplit("/", 1)[-1])
+        return CallbackResult(
+            status=200, payload={"action": _action(action_id, "completed")}
+        )
+
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            re.compile(rf"{mock_client_url}/v2/actions\?.*"),
+            status=200,
+            payload=_actions_page([]),
+            repeat=True,
+        )
+        mock_resp.get(
+            re.compile(rf"{mock_client_url}/v2/actions/\d+"),
+            callback=get,
+            repeat=True,
+        )
+
+        async with ActionWatcher(mock_aio_client, max_concurrency=2, **FAST) as watcher:
+            results = await watcher.wait_all(range(1, 7), timeout=5)
+
+    assert [action["id"] for action in results] == list(range(1, 7))
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_survives_connection_errors(mock_client_url):
+    """Tests a dropped connection counts as a failed round, not a dead task"""
+    url = re.compile(rf"{mock_client_url}/v2/actions\?.*")
+    with aioresponses() as mock_resp:
+        mock_resp.get(url, exception=aiohttp.ClientConnectionError("reset"))
+        mock_resp.get(url, status=200, payload=_actions_page([_action(1, "completed")]))
+        mock_resp.get(
+            url, exception=aiohttp.ClientConnectionError("reset"), repeat=True
+        )
+
+        async with aioClient("", endpoint=mock_client_url, retry_total=0) as client:
+            async with ActionWatcher(client, max_errors=2, **FAST) as watcher:
+                assert (await watcher.watch(1, timeout=5))["status"] == "completed"
+                with pytest.raises(ServiceRequestError):
+                    await watcher.watch(2, timeout=5)
+
+    assert watcher.requests == 4
+
+
+@responses.activate
+def test_resource_waiter_polls_until_ready(mock_client: Client, mock_client_url):
+    """Tests resources are polled until their status reaches a ready state"""
+    for status in ("new", "new", "active"):
+        responses.add(
+            responses.GET,
+            f"{mock_client_url}/v2/load_balancers/lb-1",
+            json={"load_balancer": {"id": "lb-1", "status": status}},
+        )
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/apps/app-1/deployments/dep-1",
+        json={"deployment": {"id": "dep-1", "phase": "ACTIVE"}},
+    )
+
+    with ResourceWaiter(mock_client, **FAST_RESOURCES) as waiter:
+        results = waiter.wait_all(
+            [("load_balancers", "lb-1"), ("apps", "app-1", "dep-1")], timeout=5
+        )
+
+    assert results[0]["status"] == "active"
+    assert results[1]["id"] == "dep-1"
+    assert waiter.requests == 4
+    assert len(waiter.history["load_balancers"]) == 1
+
+
+@responses.activate
+def test_resource_waiter_raises_on_failed_state(mock_client: Client, mock_client_url):
+    """Tests a terminal failure state fails the future"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/kubernetes/clusters/k8s-1",
+        json={"kubernetes_cluster": {"id": "k8s-1", "status": {"state": "error"}}},
+    )
+
+    with ResourceWaiter(mock_client, **FAST_RESOURCES) as waiter:
+        with pytest.raises(ResourceStateError) as err:
+            waiter.wait("kubernetes", "k8s-1").result(5)
+
+    assert err.value.state == "error"
+
+
+@responses.activate
+def test_resource_waiter_tolerates_transient_errors(mock_client_url):
+    """Tests failed checks are retried up to max_errors times in a row"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+    url = f"{mock_client_url}/v2/load_balancers/lb-1"
+    responses.add(responses.GET, url, status=503, json={"id": "unavailable"})
+    responses.add(responses.GET, url, json={"load_balancer": {"status": "active"}})
+    for _ in range(2):
+        responses.add(responses.GET, url, status=503, json={"id": "unavailable"})
+
+    with ResourceWaiter(client, max_errors=2, **FAST_RESOURCES) as waiter:
+        assert waiter.wait("load_balancers", "lb-1").result(5)["status"] == "active"
+        with pytest.raises(HttpResponseError):
+            waiter.wait("load_balancers", "lb-1").result(5)
+
+
+@responses.activate
+def test_resource_waiter_wait_all_cancels_on_timeout(
+    mock_client: Client, mock_client_url
+):
+    """Tests waits still pending when wait_all times out are cancelled"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/databases/db-1",
+        json={"database": {"id": "db-1", "status": "creating"}},
+    )
+
+    with ResourceWaiter(mock_client, **FAST_RESOURCES) as waiter:
+        with pytest.raises(TimeoutError):
+            waiter.wait_all([("databases", "db-1")], timeout=0.1)
+        requests_made = waiter.requests
+        time.sleep(0.2)
+        assert waiter.requests == requests_made
+
+
+@responses.activate
+def test_resource_waiter_timeout(mock_client: Client, mock_client_url):
+    """Tests a resource that never becomes ready times out"""
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/databases/db-1",
+        json={"database": {"id": "db-1", "status": "creating"}},
+    )
+
+    with ResourceWaiter(mock_client, **FAST_RESOURCES) as waiter:
+        with pytest.raises(TimeoutError):
+            waiter.wait("databases", "db-1", timeout=0.1).result(5)
+
+
+@pytest.mark.asyncio
+async def test_resource_intervals_adapt_to_history(
+    mock_aio_client: aioClient, mock_client_url, monkeypatch
+):
+    """Tests intervals grow over time but stop short of the expected finish"""
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def record_sleep(delay):
+        if delay:
+            sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    url = f"{mock_client_url}/v2/databases/db-1"
+    waiter = AsyncResourceWaiter(
+        mock_aio_client,
+        min_interval=1,
+        max_interval=60,
+        backoff=2,
+        history={"databases": [10, 12, 100]},
+    )
+    assert waiter.expected_seconds("databases") == 12
+
+    with aioresponses() as mock_resp:
+        for _ in range(6):
+            mock_resp.get(url, status=200, payload={"database": {"status": "creating"}})
+        mock_resp.get(url, status=200, payload={"database": {"status": "online"}})
+
+        await waiter.wait("databases", "db-1")
+
+    assert sleeps == pytest.approx([1, 2, 4, 8, 12, 12], abs=0.5)
+
+
+@pytest.mark.asyncio
+async def test_async_resource_waiter(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async waiter polls vector databases until active"""
+    with aioresponses() as mock_resp:
+        for status in ("creating", "active"):
+            mock_resp.get(
+                f"{mock_client_url}/v2/vector-databases/vdb-1",
+                status=200,
+                payload={"vector_db": {"id": "vdb-1", "status": status}},
+            )
+
+        waiter = AsyncResourceWaiter(mock_aio_client, **FAST_RESOURCES)
+        (database,) = await waiter.wait_all([("vector_databases", "vdb-1")], 5)
+
+    assert database["status"] == "active"
+    assert waiter.requests == 2
@@ -0,0 +1,201 @@
+# pylint: disable=duplicate-code
+
+"""Mock tests for the BIND zone-file import and export"""
+
+import io
+import json
+
+import pytest
+import requests
+import responses
+from aioresponses import aioresponses
+from azure.core.exceptions import ServiceRequestError
+
+from pydo import Client
+from pydo.aio import Client as aioClient
+from pydo.custom_zonefile import (
+    async_export_zone,
+    async_import_zone,
+    export_zone,
+    import_zone,
+    parse_zone,
+)
+from pydo.exceptions import ZoneFileError
+
+ZONE = """$ORIGIN example.com.
+$TTL 1h
+@   IN SOA ns1.digitalocean.com. hostmaster.example.com. (
+        1 7200 3600 1209600 300 ) ; managed by DigitalOcean
+@       IN NS ns1.digitalocean.com.
+@  300  IN A 203.0.113.10
+        IN AAAA 2001:db8::1
+www     IN CNAME @
+mail 600 IN MX 10 mx1
+_sip._tcp IN SRV 10 60 5060 sip.example.com.
+spf IN TXT "v=spf1 include:_spf.example.com ~all" " -all"
+@ IN CAA 0 issue "letsencrypt.org"
+$ORIGIN sub.example.com.
+host IN A 198.51.100.1
+"""
+
+
+def test_parse_zone():
+    """Tests directives, inherited owners and record data are parsed"""
+    records = list(parse_zone(io.StringIO(ZONE), "example.com"))
+
+    assert [(r["type"], r["name"]) for r in records] == [
+        ("SOA", "@"),
+        ("NS", "@"),
+        ("A", "@"),
+        ("AAAA", "@"),
+        ("CNAME", "www"),
+        ("MX", "mail"),
+        ("SRV", "_sip._tcp"),
+        ("TXT", "spf"),
+        ("CAA", "@"),
+        ("A", "host.sub"),
+    ]
+    assert records[2]["ttl"] == 300
+    assert records[3]["ttl"] == 3600
+    assert records[4]["data"] == "@"
+    assert records[5] == {
+        "type": "MX",
+        "name": "mail",
+        "priority": 10,
+        "data": "mx1.example.com.",
+        "ttl": 600,
+    }
+    assert records[6]["port"] == 5060
+    assert records[7]["data"] == "v=spf1 include:_spf.example.com ~all -all"
+    assert records[8]["tag"] == "issue"
+
+
+def test_parse_zone_is_lazy_and_reports_errors():
+    """Tests lines are consumed on demand and errors carry line numbers"""
+    consumed = []
+
+    def lines():
+        for line in ["a IN A 192.0.2.1\n", "b IN MX nope\n"]:
+            consumed.append(line)
+            yield line
+
+    records = parse_zone(lines(), "example.com")
+    assert next(records)["name"] == "a"
+    assert len(consumed) == 1
+    with pytest.raises(ZoneFileError, match="line 2"):
+        next(records)
+
+
+def test_parse_zone_ttl_units():
+    """Tests TTLs with units and rejects long non-TTL tokens quickly"""
+    zone = ["$TTL 1h30m\n", "a IN A 192.0.2.1\n", "b 2W IN A 192.0.2.2\n"]
+    records = list(parse_zone(zone, "example.com"))
+
+    assert [r["ttl"] for r in records] == [5400, 1209600]
+    with pytest.raises(ZoneFileError, match="invalid \\$TTL"):
+        list(parse_zone(["$TTL " + "1" * 64 + "x\n"], "example.com"))
+
+
+@responses.activate
+def test_export_zone_round_trips(mock_client: Client, mock_client_url):
+    """Tests exported lines parse back into the same records"""
+    records = [
+        {"id": 1, "type": "SOA", "name": "@", "data": "1800", "ttl": 1800},
+        {"id": 2, "type": "A", "name": "@", "data": "203.0.113.10", "ttl": 300},
+        {"id": 3, "type": "MX", "name": "@", "data": "mx1.example.com", "priority": 10},
+        {"id": 4, "type": "TXT", "name": "long", "data": "x" * 300, "ttl": 60},
+    ]
+    responses.add(
+        responses.GET,
+        f"{mock_client_url}/v2/domains/example.com/records",
+        json={"domain_records": records, "links": {"pages": {}}, "meta": {"total": 4}},
+    )
+    out = io.StringIO()
+
+    assert export_zone(mock_client, "example.com", out) == 3
+
+    parsed = list(parse_zone(io.StringIO(out.getvalue()), "example.com"))
+    assert [r["type"] for r in parsed] == ["A", "MX", "TXT"]
+    assert parsed[1]["data"] == "mx1.example.com."
+    assert parsed[2]["data"] == "x" * 300
+
+
+@responses.activate
+def test_import_zone_creates_records(mock_client: Client, mock_client_url):
+    """Tests supported records are created and managed ones are skipped"""
+    responses.add(
+        responses.POST,
+        f"{mock_client_url}/v2/domains/example.com/records",
+        json={"domain_record": {"id": 1}},
+        status=201,
+    )
+
+    result = import_zone(mock_client, "example.com", io.StringIO(ZONE), window=2)
+
+    assert result.created == 8
+    assert [r["type"] for r in result.skipped] == ["SOA", "NS"]
+    bodies = [json.loads(c.request.body) for c in responses.calls]
+    assert {b["type"] for b in bodies} == {
+        "A",
+        "AAAA",
+        "CNAME",
+        "MX",
+        "SRV",
+        "TXT",
+        "CAA",
+    }
+
+
+@responses.activate
+def test_import_zone_reports_connection_errors(mock_client_url):
+    """Tests a dropped connection fails one record and the import goes on"""
+    client = Client("", endpoint=mock_client_url, retry_total=0)
+
+    def create(request):
+        if json.loads(request.body)["type"] == "MX":
+            raise requests.exceptions.ConnectionError("connection reset")
+        return (201, {}, json.dumps({"domain_record": {"id": 1}}))
+
+    responses.add_callback(
+        responses.POST, f"{mock_client_url}/v2/domains/example.com/records", create
+    )
+
+    result = import_zone(client, "example.com", io.StringIO(ZONE))
+
+    assert result.created == 7
+    assert [r["type"] for r, _ in result.failed] == ["MX"]
+    assert isinstance(result.failed[0][1], ServiceRequestError)
+
+
+@pytest.mark.asyncio
+async def test_async_export_and_import(mock_aio_client: aioClient, mock_client_url):
+    """Tests the async exporter and importer"""
+    base = f"{mock_client_url}/v2/domains/example.com/records"
+    with aioresponses() as mock_resp:
+        mock_resp.get(
+            f"{base}?per_page=200&page=1",
+            status=200,
+            payload={
+                "domain_records": [
+                    {"id": 2, "type": "A", "name": "www", "data": "192.0.2.1"}
+                ],
+                "links": {"pages": {}},
+                "meta": {"total": 1},
+            },
+        )
+        mock_resp.post(base, status=201, payload={"domain_record": {"id": 3}})
+        mock_resp.post(
+            base, status=422, payload={"id": "unprocessable_entity", "message": "dup"}
+        )
+
+        out = io.StringIO()
+        assert await async_export_zone(mock_aio_client, "example.com", out) == 1
+        result = await async_import_zone(
+            mock_aio_client,
+            "example.com",
+            io.StringIO(out.getvalue() + "api IN A 192.0.2.2\n"),
+            max_concurrency=1,
+        )
+
+    assert result.created == 1
+    assert result.failed[0][0]["name"] == "api"